@@ -0,0 +1,152 @@
+import glob
+import os
+import re
+import sys
+from datetime import datetime
+
+import pandas as pd
+
+from dal import DB_PATH, get_all_pick_details, list_players
+
+ARCHIVE_DIR = os.path.join("archive", "records")
+
+# Week 0 kicks off on the last weekend of August; weeks are counted from here
+SEASON_START = (8, 24)
+# Anything fetched after the bowls (e.g. a backfill of an old season) lands in the last week
+MAX_WEEK = 20
+
+RECORD_COLUMNS = ["team", "wins", "losses", "ties", "conf_wins", "conf_losses"]
+
+CSV_BACKUP_PATTERN = re.compile(r"record_(\d{2})_(\d{2})_(\d{2})_(\d{2})\.csv$")
+
+
+def archive_dir_for(db_path=DB_PATH):
+    """``archive/records`` beside ``db_path``, so scripts run from any directory share one archive."""
+    return os.path.join(os.path.dirname(os.path.abspath(db_path)), ARCHIVE_DIR)
+
+
+def season_week(fetched_at, season):
+    start = datetime(season, *SEASON_START)
+    return min(max((fetched_at - start).days // 7, 0), MAX_WEEK)
+
+
+def records_to_frame(teams):
+    """Flatten CFBD /records entries into the archive's row layout."""
+    return pd.DataFrame(
+        [
+            (
+                r["team"],
+                r["total"]["wins"],
+                r["total"]["losses"],
+                r["total"].get("ties", 0),
+                r["conferenceGames"]["wins"],
+                r["conferenceGames"]["losses"],
+            )
+            for r in teams
+        ],
+        columns=RECORD_COLUMNS,
+    )
+
+
+def _read(season, columns, max_week=None, archive_dir=None):
+    """Read only the partitions of one season (up to ``max_week``) and the given columns."""
+    season_dir = os.path.join(archive_dir or archive_dir_for(), f"season={season}")
+    if not os.path.isdir(season_dir):
+        return pd.DataFrame(columns=columns)
+
+    filters = [("week", "<=", max_week)] if max_week is not None else None
+    df = pd.read_parquet(season_dir, columns=columns, filters=filters)
+    return df.astype({c: "int64" for c in columns if c in RECORD_COLUMNS[1:]})
+
+
+def latest_records(season, as_of=None, archive_dir=None):
+    """Latest archived record per team, optionally as of a timestamp."""
+    columns = RECORD_COLUMNS + ["fetched_at"]
+    max_week = season_week(as_of, season) if as_of is not None else None
+    df = _read(season, columns, max_week, archive_dir)
+    if as_of is not None:
+        df = df[df["fetched_at"] <= pd.Timestamp(as_of)]
+    if df.empty:
+        return df
+    return (
+        df.sort_values("fetched_at")
+        .drop_duplicates("team", keep="last")
+        .sort_values("team")
+        .reset_index(drop=True)
+    )
+
+
+def archive_snapshot(frame, fetched_at, season, archive_dir=None):
+    """Append the rows of ``frame`` that changed since the last archived snapshot.
+
+    Returns the number of rows written.
+    """
+    previous = latest_records(season, archive_dir=archive_dir)
+    if not previous.empty:
+        merged = frame.merge(previous[RECORD_COLUMNS], on="team", how="left",
+                             suffixes=("", "_prev"), indicator=True)
+        changed = merged["_merge"] == "left_only"
+        for col in RECORD_COLUMNS[1:]:
+            changed |= merged[col] != merged[f"{col}_prev"]
+        frame = frame[changed.values]
+
+    if frame.empty:
+        return 0
+
+    frame = frame.assign(fetched_at=pd.Timestamp(fetched_at))
+    week = season_week(fetched_at, season)
+    partition = os.path.join(archive_dir or archive_dir_for(), f"season={season}", f"week={week}")
+    os.makedirs(partition, exist_ok=True)
+    file_name = f"part-{fetched_at.strftime('%Y%m%d%H%M%S')}.parquet"
+    frame.to_parquet(os.path.join(partition, file_name), index=False)
+    return len(frame)
+
+
+def standings_as_of(as_of, season, archive_dir=None, db_path=DB_PATH):
+    """Main Game points per player using team records as they were at ``as_of``.
+
+    Picks and tiers come from the database; records come from the archive.
+    Returns ``[(player_id, player_name, points), ...]`` sorted by points.
+    """
+    records = latest_records(season, as_of, archive_dir or archive_dir_for(db_path))
+    losses = dict(zip(records["team"], records["losses"])) if not records.empty else {}
+
+    players = list_players(db_path)
+    points = {player.id: 0 for player in players}
+    for player_id, team, _, _, _, _, _, tier in get_all_pick_details(db_path):
+        if player_id in points:
+            points[player_id] += losses.get(team, 0) * (tier or 0)
+    return sorted(((p.id, p.name, int(points[p.id])) for p in players), key=lambda x: x[2])
+
+
+def import_csv_backups(paths, season, archive_dir=None):
+    """One-time import of the ``record_MM_DD_HH_MM.csv`` files written by get-scores.py."""
+    backups = []
+    for path in paths:
+        match = CSV_BACKUP_PATTERN.search(os.path.basename(path))
+        if not match:
+            print(f"Skipping {path}: not a record backup")
+            continue
+        month, day, hour, minute = (int(x) for x in match.groups())
+        # Names carry no year: anything before the season start is the bowls/playoff of the next January
+        year = season + 1 if (month, day) < SEASON_START else season
+        backups.append((datetime(year, month, day, hour, minute), path))
+
+    total = 0
+    for fetched_at, path in sorted(backups):
+        frame = pd.read_csv(path).rename(columns={
+            "conferenceWins": "conf_wins",
+            "conferenceLosses": "conf_losses",
+        })[RECORD_COLUMNS]
+        written = archive_snapshot(frame, fetched_at, season, archive_dir)
+        print(f"{path}: {written} changed rows archived")
+        total += written
+    return total
+
+
+if __name__ == "__main__":
+    # Usage: python archive.py <season> [record_*.csv ...]
+    season = int(sys.argv[1])
+    paths = sys.argv[2:] or sorted(glob.glob("record_*.csv"))
+    total = import_csv_backups(paths, season)
+    print(f"✅ Imported {len(paths)} backups ({total} rows) into {archive_dir_for()}")
@@ -0,0 +1,57 @@
+import statistics
+import subprocess
+import sys
+import time
+
+APP = "streamlit/pickem_app.py"
+PAGES = ["Standings", "Game Stats", "Rules"]
+RERUNS = 20
+
+COLD_START = f"""
+import time
+start = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+app = AppTest.from_file({APP!r}, default_timeout=60)
+app.session_state["page"] = {{page!r}}
+app.run()
+assert not app.exception, app.exception
+print(time.perf_counter() - start)
+"""
+
+
+def cold_start(page):
+    """First render of a page in a fresh interpreter, imports included."""
+    out = subprocess.run(
+        [sys.executable, "-c", COLD_START.format(page=page)],
+        capture_output=True, text=True, check=True,
+    )
+    return float(out.stdout.strip().splitlines()[-1])
+
+
+def rerun_latencies(page):
+    """Per-click latency once the process is warm."""
+    from streamlit.testing.v1 import AppTest
+
+    app = AppTest.from_file(APP, default_timeout=60)
+    app.session_state["page"] = page
+    app.run()
+
+    timings = []
+    for _ in range(RERUNS):
+        start = time.perf_counter()
+        app.run()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def main():
+    print(f"{'Page':<12} {'Cold start':>12} {'Rerun p50':>12} {'Rerun max':>12}")
+    for page in PAGES:
+        cold = cold_start(page)
+        reruns = rerun_latencies(page)
+        print(f"{page:<12} {cold * 1000:>10.1f}ms "
+              f"{statistics.median(reruns) * 1000:>10.1f}ms {max(reruns) * 1000:>10.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
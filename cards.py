@@ -0,0 +1,242 @@
+import functools
+import hashlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+from PIL import Image, ImageDraw, ImageFont
+
+from archive import season_week
+from dal import DB_PATH, get_model
+
+CARDS_DIR = "cards"
+LOGO_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "streamlit", "white.png")
+
+# Bump when the layout changes so every cached card is re-rendered
+TEMPLATE_VERSION = 1
+
+CARD_WIDTH = 600
+ROW_HEIGHT = 24
+LEADERBOARD_SIZE = 25
+
+BACKGROUND = (255, 255, 255)
+INK = (20, 20, 20)
+MUTED = (110, 110, 110)
+ACCENT = (178, 34, 34)
+
+PLAYER_TIER = {6: 1, 4: 2, 3: 3, 2: 4, 1: 5}
+
+
+def cards_dir_for(db_path=DB_PATH):
+    """Cards are written beside the database they were rendered from."""
+    return os.path.join(os.path.dirname(os.path.abspath(db_path)), CARDS_DIR)
+
+
+def _rank(values, reverse=False):
+    """Standard competition ranks (1, 2, 2, 4) for a ``{key: value}`` dict."""
+    ordered = sorted(values.items(), key=lambda x: x[1], reverse=reverse)
+    ranks = {}
+    for i, (key, value) in enumerate(ordered):
+        ranks[key] = ranks[ordered[i - 1][0]] if i and value == ordered[i - 1][1] else i + 1
+    return ranks
+
+
+def load_card_data(model=None):
+    """Everything a player's card shows, keyed by player id.
+
+    Scores come from the domain model, so cards match the standings pages,
+    including Main Game points scored from the frozen picks once the season
+    is locked.
+    """
+    model = model or get_model()
+    t, p = model.teams, model.players
+
+    points = dict.fromkeys(p.ids, 0)
+    points.update((player_id, pts) for _, pts, player_id in model.player_points())
+    rat_king = {player_id: score for _, score, _, player_id in model.rat_king_scores()}
+    conf_margin = {player_id: margin for _, margin, _, player_id in model.conference_champ_scores()}
+    ranks = _rank(points)
+
+    players = {}
+    for row, player_id in enumerate(p.ids):
+        players[player_id] = {
+            "name": p.names[row],
+            "picks": [
+                (t.names[team], t.wins[team], t.losses[team], t.ties[team],
+                 t.conf_wins[team], t.conf_losses[team], t.tier[team] or None)
+                for team in model.pick_rows(row)
+            ],
+            "rank": ranks[player_id],
+            "points": points[player_id],
+            "rat_king": round(rat_king[player_id], 6),
+            "conf_margin": conf_margin[player_id],
+        }
+    return players
+
+
+def content_hash(data, logo_digest):
+    payload = json.dumps(data, sort_keys=True, separators=(",", ":")).encode()
+    return hashlib.sha256(payload + logo_digest.encode() + str(TEMPLATE_VERSION).encode()).hexdigest()
+
+
+# --- Rendering (runs inside the worker processes) ---
+
+_logo = None
+_fonts = None
+_palette = None
+
+
+def _init_worker(logo_path):
+    global _logo, _fonts, _palette
+    logo = Image.open(logo_path).convert("RGBA")
+    width = CARD_WIDTH // 2
+    _logo = logo.resize((width, logo.height * width // logo.width))
+    _fonts = {
+        "title": ImageFont.load_default(size=28),
+        "body": ImageFont.load_default(size=18),
+        "small": ImageFont.load_default(size=15),
+    }
+
+    # Cards only use the logo, three ink colours and their anti-aliasing
+    # ramps, so one palette fits them all and saves quantizing every card
+    sample, y = _canvas(3)
+    for color in (INK, MUTED, ACCENT):
+        _text(sample, (20, y), "Sample 0123456789 pts", "title", color)
+        y += 40
+    _palette = sample.quantize(64, method=Image.Quantize.FASTOCTREE)
+
+
+def _canvas(rows):
+    height = _logo.height + 150 + rows * ROW_HEIGHT
+    image = Image.new("RGB", (CARD_WIDTH, height), BACKGROUND)
+    image.paste(_logo, ((CARD_WIDTH - _logo.width) // 2, 10), _logo)
+    return image, _logo.height + 20
+
+
+# Most strings (team names, records, point values) repeat across cards, so
+# each is rasterized once per worker and then just pasted
+@functools.lru_cache(maxsize=8192)
+def _text_mask(text, font):
+    _, _, right, bottom = _fonts[font].getbbox(text)
+    mask = Image.new("L", (max(right, 1), max(bottom, 1)))
+    ImageDraw.Draw(mask).text((0, 0), text, font=_fonts[font], fill=255)
+    return mask
+
+
+def _text(image, xy, text, font, fill):
+    mask = _text_mask(text, font)
+    image.paste(fill, (*xy, xy[0] + mask.width, xy[1] + mask.height), mask)
+
+
+def _save(image, path):
+    # Palette PNGs are a fraction of the size of RGB ones and far faster to encode
+    image.quantize(palette=_palette, dither=Image.Dither.NONE).save(path, compress_level=1)
+
+
+def render_player_card(job):
+    path, player = job
+    image, y = _canvas(len(player["picks"]))
+
+    _text(image, (20, y), f"#{player['rank']} {player['name']}", "title", INK)
+    y += 40
+    _text(image, (20, y), f"Main Game: {player['points']} pts", "body", ACCENT)
+    _text(image, (230, y), f"Rat King: {player['rat_king']:.1%}", "body", INK)
+    _text(image, (420, y), f"Conf: {player['conf_margin']:+d}", "body", INK)
+    y += 40
+
+    for team, w, l, t, cw, cl, tier in player["picks"]:
+        player_tier = PLAYER_TIER.get(tier, tier)
+        _text(image, (20, y), f"[T{player_tier}] {team}", "small", INK)
+        _text(image, (330, y), f"{w}-{l}-{t}  ({cw}-{cl})", "small", MUTED)
+        _text(image, (500, y), f"{l * (tier or 0)} pts", "small", ACCENT)
+        y += ROW_HEIGHT
+
+    _save(image, path)
+    return path
+
+
+def render_leaderboard(job):
+    path, title, rows = job
+    image, y = _canvas(len(rows))
+
+    _text(image, (20, y), title, "title", INK)
+    y += 50
+    for rank, name, points in rows:
+        _text(image, (20, y), f"#{rank}", "body", MUTED)
+        _text(image, (80, y), name, "body", INK)
+        _text(image, (470, y), f"{points} pts", "body", ACCENT)
+        y += ROW_HEIGHT
+
+    _save(image, path)
+    return path
+
+
+# --- Orchestration ---
+
+def generate_cards(season, cards_dir=None, logo_path=LOGO_PATH, workers=None, force=False, db_path=DB_PATH):
+    """Render cards for every player whose numbers changed, plus this week's leaderboard.
+
+    Cards go to ``cards/`` next to ``db_path`` unless ``cards_dir`` is given.
+    Returns the list of files written.
+    """
+    cards_dir = cards_dir or cards_dir_for(db_path)
+    os.makedirs(cards_dir, exist_ok=True)
+    index_path = os.path.join(cards_dir, "index.json")
+    index = {}
+    if os.path.exists(index_path) and not force:
+        with open(index_path) as file:
+            index = json.load(file)
+
+    with open(logo_path, "rb") as file:
+        logo_digest = hashlib.sha256(file.read()).hexdigest()
+    players = load_card_data(get_model(db_path))
+
+    card_jobs, new_index = [], {}
+    for player_id, player in players.items():
+        key = f"player_{player_id}"
+        digest = content_hash(player, logo_digest)
+        new_index[key] = digest
+        path = os.path.join(cards_dir, f"{key}.png")
+        if index.get(key) != digest or not os.path.exists(path):
+            card_jobs.append((path, player))
+
+    week = season_week(datetime.now(), season)
+    leaderboard = sorted(
+        ((p["rank"], p["name"], p["points"]) for p in players.values()),
+        key=lambda row: (row[0], row[1]),
+    )[:LEADERBOARD_SIZE]
+    key = f"leaderboard_{season}_week_{week}"
+    digest = content_hash(leaderboard, logo_digest)
+    new_index[key] = digest
+    path = os.path.join(cards_dir, f"{key}.png")
+    leaderboard_jobs = []
+    if index.get(key) != digest or not os.path.exists(path):
+        leaderboard_jobs.append((path, f"Week {week} Leaderboard", leaderboard))
+
+    written = []
+    if card_jobs or leaderboard_jobs:
+        with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(logo_path,)) as pool:
+            chunksize = max(1, len(card_jobs) // ((workers or os.cpu_count() or 1) * 4))
+            written.extend(pool.map(render_player_card, card_jobs, chunksize=chunksize))
+            written.extend(pool.map(render_leaderboard, leaderboard_jobs))
+
+    # Keep entries for other weeks' leaderboards; drop deleted players and their cards
+    index = {k: v for k, v in index.items() if k.startswith("leaderboard_")}
+    index.update(new_index)
+    for filename in os.listdir(cards_dir):
+        key, ext = os.path.splitext(filename)
+        if key.startswith("player_") and ext == ".png" and key not in new_index:
+            os.remove(os.path.join(cards_dir, filename))
+    with open(index_path, "w") as file:
+        json.dump(index, file, indent=2, sort_keys=True)
+    return written
+
+
+if __name__ == "__main__":
+    # Usage: python cards.py <season> [--force]
+    start = time.perf_counter()
+    written = generate_cards(int(sys.argv[1]), force="--force" in sys.argv)
+    print(f"🖼️ Rendered {len(written)} images into {cards_dir_for()}/ in {time.perf_counter() - start:.1f}s")
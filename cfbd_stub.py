@@ -0,0 +1,122 @@
+import asyncio
+import json
+import socket
+import struct
+import sys
+from urllib.parse import parse_qs, urlsplit
+
+
+def fake_records(year, teams=130):
+    return [
+        {
+            "year": year,
+            "team": f"T{i}",
+            "classification": "fbs",
+            "total": {"wins": (i + year) % 13, "losses": i % 5, "ties": 0},
+            "conferenceGames": {"wins": i % 9, "losses": i % 4},
+        }
+        for i in range(teams)
+    ]
+
+
+class StubCFBD:
+    """Local stand-in for the CFBD API, serving ``GET /records?year=N``.
+
+    Bodies are sent chunked in ``chunk_size`` pieces. The first
+    ``reset_first`` requests have their connection reset before any bytes
+    are sent, the next ``fail_first`` get a 429 with ``Retry-After:
+    retry_after``, and the first ``drop_first`` successful responses are cut
+    off after ``drop_after`` records.
+    """
+
+    def __init__(self, teams=130, chunk_size=512, fail_first=0, retry_after="0",
+                 drop_first=0, drop_after=0, retry_after_header=b"Retry-After", reset_first=0):
+        self.teams = teams
+        self.chunk_size = chunk_size
+        self.fail_first = fail_first
+        self.retry_after = retry_after
+        self.retry_after_header = retry_after_header
+        self.drop_first = drop_first
+        self.drop_after = drop_after
+        self.reset_first = reset_first
+        self.request_count = 0
+        self._server = None
+
+    @property
+    def base_url(self):
+        host, port = self._server.sockets[0].getsockname()[:2]
+        return f"http://{host}:{port}"
+
+    async def start(self, host="127.0.0.1", port=0):
+        self._server = await asyncio.start_server(self._handle, host, port)
+        return self
+
+    async def close(self):
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def _handle(self, reader, writer):
+        try:
+            request_line = await reader.readline()
+            while (await reader.readline()) not in (b"\r\n", b""):
+                pass
+            self.request_count += 1
+            url = urlsplit(request_line.split()[1].decode())
+            year = int(parse_qs(url.query).get("year", ["2025"])[0])
+
+            if self.reset_first:
+                self.reset_first -= 1
+                # SO_LINGER with a zero timeout makes close() send a RST
+                sock = writer.get_extra_info("socket")
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, struct.pack("ii", 1, 0))
+                writer.transport.abort()
+                return
+
+            if self.fail_first:
+                self.fail_first -= 1
+                writer.write(
+                    b"HTTP/1.1 429 Too Many Requests\r\n"
+                    + self.retry_after_header + b": " + self.retry_after.encode() + b"\r\n"
+                    + b"Content-Length: 0\r\nConnection: close\r\n\r\n"
+                )
+                return
+
+            records = fake_records(year, self.teams)
+            dropping = self.drop_first > 0
+            if dropping:
+                self.drop_first -= 1
+                body = ("[" + ",".join(json.dumps(r) for r in records[:self.drop_after]) + ",").encode()
+            else:
+                body = json.dumps(records).encode()
+
+            writer.write(
+                b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                b"Transfer-Encoding: chunked\r\nConnection: close\r\n\r\n"
+            )
+            for start in range(0, len(body), self.chunk_size):
+                chunk = body[start:start + self.chunk_size]
+                writer.write(f"{len(chunk):x}\r\n".encode() + chunk + b"\r\n")
+                await writer.drain()
+            if not dropping:
+                writer.write(b"0\r\n\r\n")
+        finally:
+            if not writer.is_closing():
+                await writer.drain()
+                writer.close()
+
+
+async def _serve(port):
+    stub = await StubCFBD().start(port=port)
+    print(f"🧪 Stub CFBD API on {stub.base_url} (set CFBD_BASE_URL to use it)")
+    await stub._server.serve_forever()
+
+
+if __name__ == "__main__":
+    # Usage: python cfbd_stub.py [port]
+    asyncio.run(_serve(int(sys.argv[1]) if len(sys.argv) > 1 else 8089))
@@ -0,0 +1,169 @@
+import json
+import sys
+
+from dal import DB_PATH, connection
+
+# Tables whose writes are captured in the change log
+TRACKED_TABLES = ("teams", "players", "player_picks")
+
+CHANGE_LOG_DDL = """
+    CREATE TABLE IF NOT EXISTS change_log (
+        seq INTEGER PRIMARY KEY AUTOINCREMENT,
+        table_name TEXT NOT NULL,
+        row_id INTEGER NOT NULL,
+        op TEXT NOT NULL,
+        old_data TEXT,
+        new_data TEXT,
+        changed_at TEXT NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%f', 'now'))
+    )
+"""
+
+CURSORS_DDL = """
+    CREATE TABLE IF NOT EXISTS change_log_cursors (
+        consumer TEXT PRIMARY KEY,
+        seq INTEGER NOT NULL
+    )
+"""
+
+
+def _table_columns(conn, table):
+    return [row[1] for row in conn.execute(f"PRAGMA table_info({table})")]
+
+
+def _json_row(prefix, columns):
+    pairs = ", ".join(f"'{col}', {prefix}.{col}" for col in columns)
+    return f"json_object({pairs})"
+
+
+def _trigger_sql(table, columns):
+    old_json = _json_row("OLD", columns)
+    new_json = _json_row("NEW", columns)
+    insert = "INSERT INTO change_log (table_name, row_id, op, old_data, new_data)"
+    return [
+        f"""
+        CREATE TRIGGER IF NOT EXISTS change_log_{table}_insert AFTER INSERT ON {table}
+        BEGIN
+            {insert} VALUES ('{table}', NEW.id, 'insert', NULL, {new_json});
+        END
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS change_log_{table}_update AFTER UPDATE ON {table}
+        WHEN {old_json} IS NOT {new_json}
+        BEGIN
+            {insert} VALUES ('{table}', NEW.id, 'update', {old_json}, {new_json});
+        END
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS change_log_{table}_delete AFTER DELETE ON {table}
+        BEGIN
+            {insert} VALUES ('{table}', OLD.id, 'delete', {old_json}, NULL);
+        END
+        """,
+    ]
+
+
+def install_change_log(conn):
+    """Create the change log tables and (re)build the capture triggers.
+
+    Triggers are rebuilt from the live column list so a schema change
+    (e.g. adding ``players.paid``) is picked up by re-running this.
+    """
+    conn.execute(CHANGE_LOG_DDL)
+    conn.execute(CURSORS_DDL)
+    for table in TRACKED_TABLES:
+        columns = _table_columns(conn, table)
+        if not columns:
+            continue
+        for op in ("insert", "update", "delete"):
+            conn.execute(f"DROP TRIGGER IF EXISTS change_log_{table}_{op}")
+        for sql in _trigger_sql(table, columns):
+            conn.execute(sql)
+    conn.commit()
+
+
+def ensure_change_log(conn):
+    """Install the change log only if any of its triggers are missing."""
+    cursor = conn.execute("""
+        SELECT COUNT(*) FROM sqlite_master
+        WHERE type = 'trigger' AND name LIKE 'change_log_%'
+    """)
+    if cursor.fetchone()[0] < 3 * len(TRACKED_TABLES):
+        install_change_log(conn)
+
+
+def latest_seq(conn):
+    row = conn.execute("SELECT COALESCE(MAX(seq), 0) FROM change_log").fetchone()
+    return row[0]
+
+
+def read_changes(conn, since_seq=0, tables=None, limit=None):
+    """Return changes with ``seq > since_seq`` in sequence order.
+
+    Each change is a tuple ``(seq, table_name, row_id, op, old, new, changed_at)``
+    with ``old``/``new`` decoded to dicts (or None).
+    """
+    sql = """
+        SELECT seq, table_name, row_id, op, old_data, new_data, changed_at
+        FROM change_log
+        WHERE seq > ?
+    """
+    params = [since_seq]
+    if tables:
+        sql += f" AND table_name IN ({', '.join('?' for _ in tables)})"
+        params.extend(tables)
+    sql += " ORDER BY seq"
+    if limit:
+        sql += " LIMIT ?"
+        params.append(limit)
+
+    return [
+        (seq, table, row_id, op,
+         json.loads(old) if old else None,
+         json.loads(new) if new else None,
+         changed_at)
+        for seq, table, row_id, op, old, new, changed_at in conn.execute(sql, params)
+    ]
+
+
+def get_cursor(conn, consumer):
+    row = conn.execute(
+        "SELECT seq FROM change_log_cursors WHERE consumer = ?", (consumer,)
+    ).fetchone()
+    return row[0] if row else 0
+
+
+def advance_cursor(conn, consumer, seq):
+    conn.execute("""
+        INSERT INTO change_log_cursors (consumer, seq) VALUES (?, ?)
+        ON CONFLICT(consumer) DO UPDATE SET seq = MAX(seq, excluded.seq)
+    """, (consumer, seq))
+    conn.commit()
+
+
+def consume_changes(conn, consumer, tables=None, limit=None):
+    """Read everything a consumer has not seen yet and advance its cursor."""
+    changes = read_changes(conn, get_cursor(conn, consumer), tables, limit)
+    if changes:
+        advance_cursor(conn, consumer, changes[-1][0])
+    return changes
+
+
+def print_changes(since_seq=0, db_path=DB_PATH):
+    with connection(db_path) as conn:
+        for seq, table, row_id, op, old, new, changed_at in read_changes(conn, since_seq):
+            print(f"#{seq} {changed_at} {op.upper()} {table}[{row_id}]")
+            if old:
+                print(f"    old: {old}")
+            if new:
+                print(f"    new: {new}")
+
+
+if __name__ == "__main__":
+    # Usage: python changelog.py [install | tail [since_seq]]
+    command = sys.argv[1] if len(sys.argv) > 1 else "tail"
+    if command == "install":
+        with connection() as conn:
+            install_change_log(conn)
+        print("✅ Change log installed.")
+    else:
+        print_changes(int(sys.argv[2]) if len(sys.argv) > 2 else 0)
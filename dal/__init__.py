@@ -0,0 +1,11 @@
+"""Shared data access for every app and script.
+
+Connections come from one process-wide pool (``dal.pool``) with the
+PRAGMAs and statement cache configured in one place. Reads go through the
+in-memory ``dal.model``, kept current from the change log, with a few
+typed queries in ``dal.queries`` for scripts; writes are the functions in
+``dal.writes``, submitted through ``write_queue``.
+"""
+from dal.pool import DB_PATH, connect, configure_connection, connection, ensure_schema, read_connection
+from dal.queries import Player, Team, compute_ranks, get_all_pick_details, list_players
+from dal.model import DomainModel, get_model
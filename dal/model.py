@@ -0,0 +1,397 @@
+"""Process-wide in-memory copy of teams, players and picks.
+
+Loaded once per database and then kept current from the change log: each
+``get_model()`` call costs one revision query, and only the rows that
+changed since the last call are applied. A refresh builds a new
+``DomainModel`` and swaps it in, so a model a page is reading never changes
+underneath it.
+"""
+import sqlite3
+import threading
+import warnings
+from array import array
+from typing import Optional
+
+from dal.pool import DB_PATH, read_connection
+from dal.queries import Player, Team, player_columns
+
+# Past this many pending changes a full reload is cheaper than replaying them
+MAX_INCREMENTAL_CHANGES = 5000
+
+TEAM_STATS = ("wins", "losses", "ties", "conf_wins", "conf_losses", "preseason_rank", "tier")
+
+
+class TeamTable:
+    """Column arrays indexed by row. A NULL rank or tier is stored as 0."""
+
+    __slots__ = ("ids", "names", *TEAM_STATS, "row_of", "id_of")
+
+    def __init__(self):
+        self.ids = array("q")
+        self.names = []
+        for field in TEAM_STATS:
+            setattr(self, field, array("h"))
+        self.row_of = {}
+        self.id_of = {}
+
+    def copy(self):
+        table = TeamTable.__new__(TeamTable)
+        table.ids = array("q", self.ids)
+        table.names = list(self.names)
+        for field in TEAM_STATS:
+            setattr(table, field, array("h", getattr(self, field)))
+        table.row_of = dict(self.row_of)
+        table.id_of = dict(self.id_of)
+        return table
+
+    def append(self, team_id, name, values):
+        self.row_of[team_id] = len(self.ids)
+        self.id_of[name] = team_id
+        self.ids.append(team_id)
+        self.names.append(name)
+        for field, value in zip(TEAM_STATS, values):
+            getattr(self, field).append(value or 0)
+
+    def update(self, team_id, name, values):
+        row = self.row_of[team_id]
+        if self.names[row] != name:
+            del self.id_of[self.names[row]]
+            self.id_of[name] = team_id
+            self.names[row] = name
+        for field, value in zip(TEAM_STATS, values):
+            getattr(self, field)[row] = value or 0
+
+    def team(self, row):
+        return Team(
+            self.ids[row], self.names[row], self.wins[row], self.losses[row], self.ties[row],
+            self.conf_wins[row], self.conf_losses[row], self.preseason_rank[row] or None, self.tier[row] or None,
+        )
+
+
+class PlayerTable:
+    """Player columns plus each player's picked team ids."""
+
+    __slots__ = ("ids", "names", "emails", "paid", "picks", "row_of", "id_of")
+
+    def __init__(self):
+        self.ids = array("q")
+        self.names = []
+        self.emails = []
+        self.paid = array("b")
+        self.picks = []
+        self.row_of = {}
+        self.id_of = {}
+
+    def copy(self):
+        table = PlayerTable.__new__(PlayerTable)
+        table.ids = array("q", self.ids)
+        table.names = list(self.names)
+        table.emails = list(self.emails)
+        table.paid = array("b", self.paid)
+        table.picks = [array("q", picks) for picks in self.picks]
+        table.row_of = dict(self.row_of)
+        table.id_of = dict(self.id_of)
+        return table
+
+    def append(self, player_id, name, email, paid):
+        self.row_of[player_id] = len(self.ids)
+        self.id_of[name] = player_id
+        self.ids.append(player_id)
+        self.names.append(name)
+        self.emails.append(email)
+        self.paid.append(bool(paid))
+        self.picks.append(array("q"))
+
+    def update(self, player_id, name, email, paid):
+        row = self.row_of[player_id]
+        if self.names[row] != name:
+            if self.id_of.get(self.names[row]) == player_id:
+                del self.id_of[self.names[row]]
+            self.id_of[name] = player_id
+            self.names[row] = name
+        self.emails[row] = email
+        self.paid[row] = bool(paid)
+
+    def player(self, row):
+        return Player(self.ids[row], self.names[row], self.emails[row], bool(self.paid[row]))
+
+
+class DomainModel:
+    """One immutable revision of the data, with memoized derived views."""
+
+    __slots__ = ("revision", "lock_version", "teams", "players", "frozen", "_derived")
+
+    def __init__(self, revision, lock_version, teams, players, frozen=None):
+        self.revision = revision
+        self.lock_version = lock_version
+        self.teams = teams
+        self.players = players
+        self.frozen = frozen
+        self._derived = {}
+
+    def derived(self, fn):
+        """``fn(model)``, computed once per model; callers must not mutate the result."""
+        try:
+            return self._derived[fn]
+        except KeyError:
+            value = self._derived[fn] = fn(self)
+            return value
+
+    # --- Lookups ---
+
+    def team(self, team_id) -> Optional[Team]:
+        row = self.teams.row_of.get(team_id)
+        return self.teams.team(row) if row is not None else None
+
+    def team_list(self) -> list[Team]:
+        return self.derived(_team_list)
+
+    def player_list(self) -> list[Player]:
+        return self.derived(_player_list)
+
+    def pick_names(self, player_id) -> list[str]:
+        row = self.players.row_of.get(player_id)
+        if row is None:
+            return []
+        return [self.teams.names[self.teams.row_of[team_id]] for team_id in self.players.picks[row]]
+
+    def pick_rows(self, player_row):
+        """Team rows of one player's picks."""
+        row_of = self.teams.row_of
+        return [row_of[team_id] for team_id in self.players.picks[player_row]]
+
+    # --- Views used by the pages ---
+
+    def teams_by_tier(self):
+        return self.derived(_teams_by_tier)
+
+    def team_stats(self):
+        return self.derived(_team_stats)
+
+    def pick_popularity(self):
+        return self.derived(_pick_popularity)
+
+    def player_points(self):
+        return self.derived(_player_points)
+
+    def rat_king_scores(self):
+        return self.derived(_rat_king_scores)
+
+    def conference_champ_scores(self):
+        return self.derived(_conference_champ_scores)
+
+    # --- Refresh ---
+
+    def apply(self, changes):
+        """A new model with ``changes`` (from ``read_changes``) applied, or None if a reload is needed."""
+        teams, players = self.teams.copy(), self.players.copy()
+        for seq, table, row_id, op, old, new, _ in changes:
+            if table == "teams":
+                if op == "delete":
+                    return None
+                values = [new.get(field) for field in TEAM_STATS]
+                if row_id in teams.row_of:
+                    teams.update(row_id, new["name"], values)
+                else:
+                    teams.append(row_id, new["name"], values)
+            elif table == "players":
+                if op == "delete":
+                    return None
+                fields = (new["name"], new["email"], new.get("paid"))
+                if row_id in players.row_of:
+                    players.update(row_id, *fields)
+                else:
+                    players.append(row_id, *fields)
+            elif table == "player_picks" and self.frozen is None:
+                for data, remove in ((old, True), (new, False)):
+                    if data is None:
+                        continue
+                    row = players.row_of.get(data["player_id"])
+                    if row is None or data["team_id"] not in teams.row_of:
+                        return None
+                    picks = players.picks[row]
+                    if remove:
+                        if data["team_id"] not in picks:
+                            return None
+                        picks.remove(data["team_id"])
+                    else:
+                        picks.append(data["team_id"])
+
+        revision = changes[-1][0] if changes else self.revision
+        return DomainModel(revision, self.lock_version, teams, players, self.frozen)
+
+
+def _team_list(model):
+    teams = model.teams
+    return [teams.team(row) for row in sorted(range(len(teams.ids)), key=teams.names.__getitem__)]
+
+
+def _player_list(model):
+    players = model.players
+    return [players.player(row) for row in sorted(range(len(players.ids)), key=players.names.__getitem__)]
+
+
+def _teams_by_tier(model):
+    """``{tier: [(label, team_id), ...]}`` for the pick form, best preseason rank first."""
+    teams = model.teams
+    ranked = sorted(
+        (row for row in range(len(teams.ids)) if teams.tier[row]),
+        key=lambda row: (teams.preseason_rank[row] != 0, teams.preseason_rank[row]),
+    )
+    tiers = {1: [], 2: [], 3: [], 4: [], 6: []}
+    for row in ranked:
+        tier, rank, name = teams.tier[row], teams.preseason_rank[row], teams.names[row]
+        if tier in tiers:
+            label = f"#{rank} {name} (Pts/Loss: {tier})" if rank else f"{name} (Pts/Loss: {tier})"
+            tiers[tier].append((label, teams.ids[row]))
+    return tiers
+
+
+def _team_stats(model):
+    """``(name, wins, losses, ties, conf_wins, conf_losses, rank, tier)`` per team, by name."""
+    t = model.teams
+    return [
+        (t.names[row], t.wins[row], t.losses[row], t.ties[row], t.conf_wins[row], t.conf_losses[row],
+         t.preseason_rank[row] or "-", t.tier[row] or "-")
+        for row in sorted(range(len(t.ids)), key=t.names.__getitem__)
+    ]
+
+
+def _pick_popularity(model):
+    """``(team name, tier, times picked)``, most picked first."""
+    counts = {}
+    for picks in model.players.picks:
+        for team_id in picks:
+            counts[team_id] = counts.get(team_id, 0) + 1
+    t = model.teams
+    rows = [(t.names[t.row_of[team_id]], t.tier[t.row_of[team_id]] or None, count) for team_id, count in counts.items()]
+    return sorted(rows, key=lambda row: row[2], reverse=True)
+
+
+# The score rows below end with the player id so callers can find a player's
+# picks without going through names, which two players can share
+
+
+def _player_points(model):
+    """``(name, points, player_id)`` per player; scored against the frozen picks while the season is locked."""
+    t, p = model.teams, model.players
+    if model.frozen is not None:
+        points_by_team = {t.ids[row]: t.losses[row] * t.tier[row] for row in range(len(t.ids))}
+        totals = model.frozen.player_totals(model.frozen.team_vector(points_by_team))
+        return [
+            (p.names[p.row_of[int(player_id)]], int(points), int(player_id))
+            for player_id, points in zip(model.frozen.player_ids, totals)
+            if int(player_id) in p.row_of
+        ]
+    return [
+        (p.names[row], sum(t.losses[team] * t.tier[team] for team in model.pick_rows(row)), p.ids[row])
+        for row in range(len(p.ids))
+    ]
+
+
+def _rat_king_scores(model):
+    """``(name, average tier 5 win rate, [(team, wins, losses), ...], player_id)`` per player."""
+    t, p = model.teams, model.players
+    scores = []
+    for row in range(len(p.ids)):
+        details = [(t.names[team], t.wins[team], t.losses[team]) for team in model.pick_rows(row) if t.tier[team] == 1]
+        rates = [w / (w + l) if w + l else 0 for _, w, l in details]
+        scores.append((p.names[row], sum(rates) / len(rates) if rates else 0.0, details, p.ids[row]))
+    return scores
+
+
+def _conference_champ_scores(model):
+    """``(name, conference margin, [(team, conf_wins, conf_losses), ...], player_id)`` per player."""
+    t, p = model.teams, model.players
+    results = []
+    for row in range(len(p.ids)):
+        data = [(t.names[team], t.conf_wins[team], t.conf_losses[team]) for team in model.pick_rows(row)]
+        results.append((p.names[row], sum(w - l for _, w, l in data), data, p.ids[row]))
+    return results
+
+
+def load_model(conn, lock_version=None, db_path=DB_PATH):
+    """Read everything in one transaction so the tables match the revision.
+
+    While the season is locked, picks come from the frozen artifact so every
+    game is scored from the same picks.
+    """
+    from changelog import latest_seq
+    from season_lock import MissingArtifactError, load_frozen_picks
+
+    conn.execute("BEGIN")
+    try:
+        try:
+            revision = latest_seq(conn)
+        except sqlite3.OperationalError:
+            revision = 0
+
+        teams = TeamTable()
+        for team_id, name, *values in conn.execute(
+            f"SELECT id, name, {', '.join(TEAM_STATS)} FROM teams ORDER BY id"
+        ):
+            teams.append(team_id, name, values)
+
+        players = PlayerTable()
+        for player_id, name, email, paid in conn.execute(f"SELECT {player_columns(conn)} FROM players ORDER BY id"):
+            players.append(player_id, name, email, paid)
+
+        frozen = None
+        if lock_version is not None:
+            try:
+                frozen = load_frozen_picks(conn, db_path)
+            except MissingArtifactError as e:
+                warnings.warn(f"{e} Scoring from the live picks instead.")
+
+        if frozen is not None:
+            picks = (
+                (int(player_id), int(team_id))
+                for i, player_id in enumerate(frozen.player_ids)
+                for team_id in frozen.team_ids[frozen.pick_matrix[i].nonzero()[0]]
+            )
+        else:
+            picks = conn.execute("SELECT player_id, team_id FROM player_picks ORDER BY id")
+        for player_id, team_id in picks:
+            row = players.row_of.get(player_id)
+            if row is not None and team_id in teams.row_of:
+                players.picks[row].append(team_id)
+    finally:
+        conn.rollback()
+    return DomainModel(revision, lock_version, teams, players, frozen)
+
+
+_models = {}
+_models_lock = threading.Lock()
+
+
+def get_model(db_path=DB_PATH) -> DomainModel:
+    """The current model for ``db_path``, brought up to date with the change log."""
+    from changelog import latest_seq, read_changes
+    from season_lock import locked_version
+
+    with read_connection(db_path) as conn:
+        try:
+            revision = latest_seq(conn)
+        except sqlite3.OperationalError:
+            revision = 0
+        lock_version = locked_version(conn)
+
+        model = _models.get(db_path)
+        if model is not None and model.revision == revision and model.lock_version == lock_version:
+            return model
+
+        with _models_lock:
+            model = _models.get(db_path)
+            if model is not None and model.revision >= revision and model.lock_version == lock_version:
+                return model
+
+            refreshed = None
+            if model is not None and model.lock_version == lock_version:
+                changes = read_changes(conn, model.revision, limit=MAX_INCREMENTAL_CHANGES + 1)
+                if len(changes) <= MAX_INCREMENTAL_CHANGES:
+                    refreshed = model.apply(changes)
+            if refreshed is None:
+                refreshed = load_model(conn, lock_version, db_path)
+
+            _models[db_path] = refreshed
+            return refreshed
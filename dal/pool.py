@@ -0,0 +1,124 @@
+import os
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+# One database for every app and script, regardless of the working directory
+DB_PATH = os.environ.get(
+    "CFBPICKEM_DB",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "cfbpickem.db"),
+)
+
+# Serve reads from an in-memory copy of the database (see replica.py)
+USE_READ_REPLICA = os.environ.get("CFBPICKEM_READ_REPLICA") == "1"
+
+# Applied to every connection this process opens, including SQLAlchemy's.
+# None of these change the database file; WAL mode (which does) is set by
+# ensure_schema, from writers only.
+PRAGMAS = {
+    "synchronous": "NORMAL",
+    "cache_size": -16000,  # KiB, i.e. 16 MB
+    "mmap_size": 256 * 1024 * 1024,
+    "busy_timeout": 10000,
+    "temp_store": "MEMORY",
+}
+
+# Per-connection prepared statement cache (sqlite3 keeps an LRU keyed on the SQL text)
+CACHED_STATEMENTS = 256
+
+
+def configure_connection(conn):
+    for name, value in PRAGMAS.items():
+        conn.execute(f"PRAGMA {name} = {value}")
+    return conn
+
+
+def connect(db_path=DB_PATH, **kwargs):
+    """Open a configured connection that is not part of the pool."""
+    conn = sqlite3.connect(db_path, cached_statements=CACHED_STATEMENTS, check_same_thread=False, **kwargs)
+    return configure_connection(conn)
+
+
+def ensure_schema(conn):
+    """Bring an existing database up to date with models.py and the change log.
+
+    Only writers call this (the write queue and init_db.py), so reading a
+    database never changes it. The checks run inside BEGIN IMMEDIATE, so
+    processes starting at the same time migrate it once.
+    """
+    from changelog import ensure_change_log, install_change_log
+
+    if conn.in_transaction:
+        conn.commit()
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        if "players" in tables:
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(players)")}
+            if "paid" not in columns:
+                conn.execute("ALTER TABLE players ADD COLUMN paid BOOLEAN DEFAULT 0")
+                # Rebuild the capture triggers so they include the new column
+                install_change_log(conn)
+            else:
+                ensure_change_log(conn)
+        if conn.in_transaction:
+            conn.commit()
+    except BaseException:
+        if conn.in_transaction:
+            conn.rollback()
+        raise
+
+
+class ConnectionPool:
+    """Process-wide pool of configured connections to the primary file.
+
+    Connections are long-lived, so PRAGMA setup and the prepared statement
+    cache are paid for once instead of on every request.
+    """
+
+    def __init__(self, db_path=DB_PATH, size=8):
+        self.db_path = db_path
+        self.size = size
+        self._idle = queue.LifoQueue()
+
+    @contextmanager
+    def connection(self):
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            conn = connect(self.db_path)
+        try:
+            yield conn
+        finally:
+            if conn.in_transaction:
+                conn.rollback()
+            if self._idle.qsize() < self.size:
+                self._idle.put(conn)
+            else:
+                conn.close()
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(db_path=DB_PATH):
+    with _pools_lock:
+        if db_path not in _pools:
+            _pools[db_path] = ConnectionPool(db_path)
+        return _pools[db_path]
+
+
+def connection(db_path=DB_PATH):
+    """Borrow a pooled connection to the primary database."""
+    return get_pool(db_path).connection()
+
+
+def read_connection(db_path=DB_PATH):
+    """Borrow a connection for reads: the in-memory replica if enabled, else the pool."""
+    if USE_READ_REPLICA:
+        from replica import get_replica
+        return get_replica(db_path).connection()
+    return connection(db_path)
@@ -0,0 +1,68 @@
+from typing import NamedTuple, Optional
+
+from dal.pool import DB_PATH, read_connection
+
+
+class Team(NamedTuple):
+    id: int
+    name: str
+    wins: int
+    losses: int
+    ties: int
+    conf_wins: int
+    conf_losses: int
+    preseason_rank: Optional[int]
+    tier: Optional[int]
+
+
+class Player(NamedTuple):
+    id: int
+    name: str
+    email: Optional[str]
+    paid: bool
+
+
+def player_columns(conn) -> str:
+    """Player columns, reading ``paid`` as false in a database the writer hasn't migrated yet."""
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(players)")}
+    return "id, name, email, " + ("paid" if "paid" in columns else "0 AS paid")
+
+
+# --- Players and picks ---
+
+def list_players(db_path: str = DB_PATH) -> list[Player]:
+    with read_connection(db_path) as conn:
+        rows = conn.execute(f"SELECT {player_columns(conn)} FROM players ORDER BY name").fetchall()
+    return [Player(id, name, email, bool(paid)) for id, name, email, paid in rows]
+
+def get_all_pick_details(db_path: str = DB_PATH) -> list[tuple]:
+    """Every pick as ``(player_id, team, wins, losses, ties, conf_wins, conf_losses, tier)``."""
+    with read_connection(db_path) as conn:
+        return conn.execute("""
+            SELECT p.player_id, t.name, t.wins, t.losses, t.ties, t.conf_wins, t.conf_losses, t.tier
+            FROM player_picks p
+            JOIN teams t ON p.team_id = t.id
+            ORDER BY t.tier DESC, t.name
+        """).fetchall()
+
+# --- Standings ---
+
+def compute_ranks(data: list[tuple], reverse: bool = False) -> list[tuple]:
+    # Sort data (name, value, ...) by value (index 1)
+    sorted_data = sorted(data, key=lambda x: x[1], reverse=reverse)
+
+    ranked = []
+    last_score = None
+    current_rank = 0
+    num_tied = 0
+
+    for i, entry in enumerate(sorted_data):
+        score = entry[1]
+        if score == last_score:
+            num_tied += 1
+        else:
+            current_rank = current_rank + num_tied + 1
+            num_tied = 0
+            last_score = score
+        ranked.append((current_rank, *entry))
+    return ranked
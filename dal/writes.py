@@ -0,0 +1,91 @@
+"""Write operations.
+
+Each function takes the writer's connection as its first argument and is
+meant to be submitted to the write queue, e.g. ``run_write(add_pick, 3, 17)``.
+Player and pick changes raise SeasonLockedError once the season is frozen.
+"""
+from typing import Iterable, Optional
+
+
+def _check_not_locked(conn):
+    from season_lock import check_not_locked
+
+    check_not_locked(conn)
+
+
+UPSERT_RECORD_SQL = """
+    INSERT INTO teams (name, wins, losses, ties, conf_wins, conf_losses)
+    VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT(name) DO UPDATE SET
+        wins = excluded.wins,
+        losses = excluded.losses,
+        ties = excluded.ties,
+        conf_wins = excluded.conf_wins,
+        conf_losses = excluded.conf_losses
+"""
+
+
+def update_team_stats(conn, team_id: int, wins: int, losses: int, ties: int, conf_wins: int,
+                      conf_losses: int, tier: int, preseason_rank: int) -> None:
+    conn.execute("""
+        UPDATE teams SET wins=?, losses=?, ties=?, conf_wins=?, conf_losses=?, tier=?, preseason_rank=?
+        WHERE id = ?
+    """, (wins, losses, ties, conf_wins, conf_losses, tier, preseason_rank, team_id))
+
+def upsert_records(conn, rows: Iterable[tuple]) -> None:
+    """Rows are ``(name, wins, losses, ties, conf_wins, conf_losses)``; rank and tier are left alone."""
+    conn.executemany(UPSERT_RECORD_SQL, rows)
+
+def set_preseason_rank(conn, team: str, rank: Optional[int], tier: Optional[int]) -> int:
+    """Returns the number of teams updated (0 for an unknown name)."""
+    return conn.execute("""
+        UPDATE teams
+        SET preseason_rank = ?, tier = ?
+        WHERE name = ?
+    """, (rank, tier, team)).rowcount
+
+def add_player(conn, name: str, email: str, paid: bool = False) -> int:
+    _check_not_locked(conn)
+    return conn.execute(
+        "INSERT INTO players (name, email, paid) VALUES (?, ?, ?)", (name, email, int(paid))
+    ).lastrowid
+
+def delete_player(conn, player_id: int) -> None:
+    _check_not_locked(conn)
+    conn.execute("DELETE FROM player_picks WHERE player_id = ?", (player_id,))
+    conn.execute("DELETE FROM players WHERE id = ?", (player_id,))
+
+def set_paid(conn, player_id: int, paid: bool) -> None:
+    conn.execute("UPDATE players SET paid = ? WHERE id = ?", (int(paid), player_id))
+
+def add_pick(conn, player_id: int, team_id: int) -> None:
+    _check_not_locked(conn)
+    conn.execute("INSERT INTO player_picks (player_id, team_id) VALUES (?, ?)", (player_id, team_id))
+
+def remove_pick(conn, player_id: int, team_id: int) -> None:
+    _check_not_locked(conn)
+    conn.execute("DELETE FROM player_picks WHERE player_id = ? AND team_id = ?", (player_id, team_id))
+
+def save_picks(conn, name: str, email: str, team_ids: Iterable[int]) -> int:
+    """Create or update the player for ``email`` and replace their picks.
+
+    Raises SeasonLockedError once the season is frozen; the check runs inside
+    the write so a submission can't race the freeze.
+    """
+    _check_not_locked(conn)
+    email = email.lower().strip()
+    cursor = conn.cursor()
+    cursor.execute("SELECT id, name FROM players WHERE email = ?", (email,))
+    row = cursor.fetchone()
+
+    if row:
+        player_id = row[0]
+        cursor.execute("UPDATE players SET name = ? WHERE id = ?", (name, player_id))
+        cursor.execute("DELETE FROM player_picks WHERE player_id = ?", (player_id,))
+    else:
+        cursor.execute("INSERT INTO players (name, email) VALUES (?, ?)", (name, email))
+        player_id = cursor.lastrowid
+
+    cursor.executemany("INSERT INTO player_picks (player_id, team_id) VALUES (?, ?)",
+                       [(player_id, team_id) for team_id in team_ids])
+    return player_id
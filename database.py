@@ -1,7 +1,15 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import declarative_base, sessionmaker
 
-engine = create_engine("sqlite:///cfbpickem.db", echo=False)
+from dal import DB_PATH, configure_connection
+
+engine = create_engine(f"sqlite:///{DB_PATH}", echo=False)
+
+
+@event.listens_for(engine, "connect")
+def _configure(dbapi_connection, connection_record):
+    # Same PRAGMAs as the dal pool; init_db.py migrates the schema
+    configure_connection(dbapi_connection)
 
 Base = declarative_base()
 
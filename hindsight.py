@@ -0,0 +1,194 @@
+import math
+import sys
+import time
+from fractions import Fraction
+from typing import NamedTuple
+
+import numpy as np
+
+from dal import get_model
+
+# Teams a lineup takes from each database tier (player tiers 1-5, see submit_picks.py)
+PICKS_PER_TIER = {6: 1, 4: 2, 3: 3, 2: 4, 1: 5}
+RAT_KING_TIER = 1
+
+
+# Rat King rates are exact fractions: float sums of equal rates can differ in
+# the last bit and keep dominated lineups on the frontier
+class Lineup(NamedTuple):
+    points: int
+    rat_king: Fraction
+    conf_margin: int
+    team_ids: tuple
+
+
+class PlayerGap(NamedTuple):
+    name: str
+    points: int
+    rat_king: Fraction
+    conf_margin: int
+    points_gap: int
+    rat_king_gap: Fraction
+    conf_margin_gap: int
+    dominated: bool
+
+
+def _win_rate(wins, losses):
+    total = wins + losses
+    return Fraction(wins, total) if total else Fraction(0)
+
+
+def _pareto(states):
+    """Keep the states of ``{(points, margin): (rate_sum, team_ids)}`` that no other state dominates.
+
+    Points are minimized, margin and rate maximized. Rates are integer
+    numerators over a common denominator, so comparisons are exact.
+    """
+    keys = list(states)
+    if len(keys) < 2:
+        return states
+    objectives = np.array([(-p, m, states[p, m][0]) for p, m in keys])
+    keep = np.ones(len(keys), dtype=bool)
+    for i in range(len(keys)):
+        if not keep[i]:
+            continue
+        dominated = np.all(objectives <= objectives[i], axis=1) & np.any(objectives < objectives[i], axis=1)
+        keep &= ~dominated
+    return {key: states[key] for key, kept in zip(keys, keep) if kept}
+
+
+def _tier_frontier(teams, picks, points_per_loss):
+    """Non-dominated ways to pick ``picks`` teams from one tier.
+
+    A knapsack over (teams picked, points, margin), pruned to its Pareto
+    front after every team: a partial pick that is dominated stays dominated
+    whatever is added to it, so only a handful of states survive.
+    """
+    layers = [{(0, 0): (0, ())}] + [{} for _ in range(picks)]
+    for team_id, losses, margin, rate in teams:
+        for count in range(picks - 1, -1, -1):
+            target = layers[count + 1]
+            for (points, total_margin), (rate_sum, team_ids) in layers[count].items():
+                key = (points + losses * points_per_loss, total_margin + margin)
+                value = (rate_sum + rate, team_ids + (team_id,))
+                if key not in target or value[0] > target[key][0]:
+                    target[key] = value
+            if target:
+                layers[count + 1] = _pareto(target)
+    return layers[picks]
+
+
+def _combine(left, right):
+    combined = {}
+    for (p1, m1), (r1, ids1) in left.items():
+        for (p2, m2), (r2, ids2) in right.items():
+            key = (p1 + p2, m1 + m2)
+            if key not in combined or r1 + r2 > combined[key][0]:
+                combined[key] = (r1 + r2, ids1 + ids2)
+    return _pareto(combined)
+
+
+def solve(teams):
+    """Pareto frontier of full lineups given the current records.
+
+    Main Game points and conference margin add up across tiers and the Rat
+    King rate only depends on the tier 5 picks, so each tier is solved on its
+    own and the per-tier fronts are merged. ``teams`` are ``dal.Team`` rows.
+    Returns the frontier as ``Lineup``s, fewest points first.
+    """
+    teams = sorted((t for t in teams if t.tier in PICKS_PER_TIER), key=lambda t: t.name)
+    # Win rates as integers over the least common multiple of the games played
+    denominator = math.lcm(*(t.wins + t.losses for t in teams if t.tier == RAT_KING_TIER and t.wins + t.losses))
+
+    by_tier = {tier: [] for tier in PICKS_PER_TIER}
+    for team in teams:
+        rate = 0
+        if team.tier == RAT_KING_TIER and team.wins + team.losses:
+            rate = team.wins * (denominator // (team.wins + team.losses))
+        by_tier[team.tier].append((team.id, team.losses, team.conf_wins - team.conf_losses, rate))
+
+    frontier = {(0, 0): (0, ())}
+    for tier, picks in PICKS_PER_TIER.items():
+        if len(by_tier[tier]) < picks:
+            return []
+        frontier = _combine(frontier, _tier_frontier(by_tier[tier], picks, tier))
+
+    rat_king_picks = PICKS_PER_TIER[RAT_KING_TIER]
+    lineups = [
+        Lineup(points, Fraction(rate_sum, denominator * rat_king_picks), margin, team_ids)
+        for (points, margin), (rate_sum, team_ids) in frontier.items()
+    ]
+    return sorted(lineups, key=lambda l: (l.points, -l.rat_king, -l.conf_margin))
+
+
+def best_lineup(frontier):
+    """The Main Game winner: fewest points, then the best side-pot numbers."""
+    return frontier[0] if frontier else None
+
+
+def player_gaps(frontier, players):
+    """How far each player's picks are from the best achievable in each game.
+
+    ``players`` is ``[(name, [(losses, wins, conf_wins, conf_losses, tier), ...]), ...]``.
+    A player is ``dominated`` when some lineup beats them in all three games at once.
+    """
+    if not frontier:
+        return []
+    best_points = min(l.points for l in frontier)
+    best_rat_king = max(l.rat_king for l in frontier)
+    best_margin = max(l.conf_margin for l in frontier)
+    front = [(-l.points, l.rat_king, l.conf_margin) for l in frontier]
+
+    gaps = []
+    for name, picks in players:
+        points = sum(losses * tier for losses, _, _, _, tier in picks)
+        rates = [_win_rate(wins, losses) for losses, wins, _, _, tier in picks if tier == RAT_KING_TIER]
+        rat_king = sum(rates) / len(rates) if rates else Fraction(0)
+        margin = sum(cw - cl for _, _, cw, cl, _ in picks)
+
+        mine = (-points, rat_king, margin)
+        dominated = any(
+            all(a >= b for a, b in zip(lineup, mine)) and any(a > b for a, b in zip(lineup, mine))
+            for lineup in front
+        )
+        gaps.append(PlayerGap(
+            name, points, rat_king, margin,
+            points - best_points, best_rat_king - rat_king, best_margin - margin, dominated,
+        ))
+    return sorted(gaps, key=lambda g: (g.points_gap, g.name))
+
+
+def hindsight_report(model=None):
+    """Solve against the current records. Returns ``(frontier, player_gaps, team_names)``."""
+    model = model or get_model()
+    frontier = solve(model.team_list())
+
+    t, p = model.teams, model.players
+    players = [
+        (p.names[row], [
+            (t.losses[team], t.wins[team], t.conf_wins[team], t.conf_losses[team], t.tier[team])
+            for team in model.pick_rows(row)
+        ])
+        for row in range(len(p.ids))
+    ]
+    return frontier, player_gaps(frontier, players), dict(zip(t.ids, t.names))
+
+
+if __name__ == "__main__":
+    # Usage: python hindsight.py
+    start = time.perf_counter()
+    frontier, gaps, team_names = hindsight_report()
+    elapsed = time.perf_counter() - start
+    if not frontier:
+        print("Not enough tiered teams to build a lineup")
+        sys.exit(1)
+
+    print(f"🔮 {len(frontier)} Pareto-optimal lineups (solved in {elapsed * 1000:.0f} ms)")
+    for lineup in frontier:
+        teams = ", ".join(team_names[team_id] for team_id in lineup.team_ids)
+        print(f"{lineup.points:>4} pts  {float(lineup.rat_king):6.1%}  {lineup.conf_margin:+4d}  {teams}")
+    print()
+    for gap in gaps:
+        flag = "" if gap.dominated else "  ⭐ on the frontier"
+        print(f"{gap.name}: +{gap.points_gap} pts, -{float(gap.rat_king_gap):.1%} Rat King, "
+              f"-{gap.conf_margin_gap} conf margin{flag}")
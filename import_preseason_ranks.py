@@ -1,5 +1,7 @@
 import csv
-import sqlite3
+from dal import DB_PATH
+from dal.writes import set_preseason_rank
+from write_queue import get_write_queue
 
 def calculate_tier(rank):
     if not rank:
@@ -16,9 +18,9 @@ def calculate_tier(rank):
     else:
         return 1
 
-def update_preseason_ranks(csv_path, db_path="cfbpickem.db"):
-    conn = sqlite3.connect(db_path)
-    c = conn.cursor()
+def update_preseason_ranks(csv_path, db_path=DB_PATH):
+    writer = get_write_queue(db_path)
+    updates = []
 
     with open(csv_path, newline='', encoding='utf-8') as csvfile:
         reader = csv.DictReader(csvfile)
@@ -28,15 +30,12 @@ def update_preseason_ranks(csv_path, db_path="cfbpickem.db"):
             rank = int(rank_str) if rank_str else None
             tier = calculate_tier(rank) if rank else None
 
-            c.execute("""
-                UPDATE teams
-                SET preseason_rank = ?, tier = ?
-                WHERE name = ?
-            """, (rank, tier, team))
+            updates.append((team, writer.submit(set_preseason_rank, team, rank, tier)))
 
+    for team, future in updates:
+        if not future.result():
+            print(f"⚠️ No team named {team!r} in the database")
 
-    conn.commit()
-    conn.close()
     print("✅ Preseason rankings and tiers updated in SQLite.")
 
 if __name__ == "__main__":
@@ -0,0 +1,237 @@
+import asyncio
+import codecs
+import email.utils
+import json
+import os
+import random
+import sys
+import time
+from datetime import datetime, timezone
+from urllib.parse import urlencode
+
+import httpcore
+
+from archive import archive_dir_for, archive_snapshot, records_to_frame
+from dal import DB_PATH
+from dal.writes import upsert_records
+from write_queue import get_write_queue
+
+CFBD_BASE_URL = os.environ.get("CFBD_BASE_URL", "https://api.collegefootballdata.com")
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+class CFBDError(Exception):
+    pass
+
+
+def record_row(r):
+    return (
+        r["team"],
+        r["total"]["wins"],
+        r["total"]["losses"],
+        r["total"].get("ties", 0),
+        r["conferenceGames"]["wins"],
+        r["conferenceGames"]["losses"],
+    )
+
+
+def parse_retry_after(value):
+    """Seconds to wait from a ``Retry-After`` header (delta-seconds or HTTP-date), or None."""
+    if not value:
+        return None
+    value = value.decode("latin-1").strip()
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return (when - datetime.now(timezone.utc)).total_seconds()
+
+
+async def iter_json_array(chunks):
+    """Yield the elements of a top-level JSON array as its bytes arrive.
+
+    Elements must be objects or arrays (true for every CFBD endpoint), which
+    lets a partial element be told apart from a complete one.
+    """
+    decoder = json.JSONDecoder()
+    utf8 = codecs.getincrementaldecoder("utf-8")()
+    buffer = ""
+    started = False
+
+    async for chunk in chunks:
+        buffer += utf8.decode(chunk)
+        pos = 0
+        while True:
+            while pos < len(buffer) and buffer[pos] in " \t\r\n,":
+                pos += 1
+            if pos == len(buffer):
+                break
+            if not started:
+                if buffer[pos] != "[":
+                    raise CFBDError("Expected a JSON array")
+                started = True
+                pos += 1
+                continue
+            if buffer[pos] == "]":
+                return
+            try:
+                item, pos = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                break
+            yield item
+        buffer = buffer[pos:]
+
+    if buffer.strip() or not started:
+        raise CFBDError("Truncated JSON array")
+
+
+class CFBDClient:
+    """Pooled async client for the CollegeFootballData API.
+
+    At most ``concurrency`` requests are in flight. Requests that fail with
+    a connection error or a retryable status are retried with exponential
+    backoff plus jitter, honouring ``Retry-After`` on 429s. When
+    ``requests_per_second`` is set, request starts are spaced out to stay
+    under the API's rate limit.
+    """
+
+    def __init__(self, api_key, base_url=CFBD_BASE_URL, concurrency=8, max_retries=5,
+                 backoff=0.5, requests_per_second=None, timeout=30.0, max_delay=60.0):
+        self.base_url = base_url.rstrip("/")
+        self.headers = [
+            (b"Accept", b"application/json"),
+            (b"Authorization", f"Bearer {api_key}".encode()),
+        ]
+        self.concurrency = concurrency
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_delay = max_delay
+        self.min_interval = 1.0 / requests_per_second if requests_per_second else 0.0
+        self.timeout = timeout
+        self.request_count = 0
+        self._next_start = 0.0
+        self._pace_lock = asyncio.Lock()
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._pool = None
+
+    async def __aenter__(self):
+        self._pool = httpcore.AsyncConnectionPool(max_connections=self.concurrency)
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self._pool.aclose()
+
+    async def _pace(self):
+        if not self.min_interval:
+            return
+        async with self._pace_lock:
+            now = time.monotonic()
+            wait = self._next_start - now
+            self._next_start = max(now, self._next_start) + self.min_interval
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def _retry_delay(self, attempt, retry_after=None):
+        if retry_after is not None:
+            delay = retry_after
+        else:
+            delay = self.backoff * 2 ** attempt * random.uniform(0.5, 1.5)
+        return min(max(delay, 0.0), self.max_delay)
+
+    async def stream(self, path, params=None):
+        """Yield the JSON array elements returned by ``GET path``.
+
+        Retries only happen before the first element is yielded, so callers
+        never see duplicates.
+        """
+        url = f"{self.base_url}{path}"
+        if params:
+            url += f"?{urlencode(params)}"
+        extensions = {"timeout": {"connect": self.timeout, "read": self.timeout, "pool": self.timeout}}
+
+        async with self._semaphore:
+            for attempt in range(self.max_retries + 1):
+                await self._pace()
+                self.request_count += 1
+                yielded = False
+                try:
+                    async with self._pool.stream("GET", url, headers=self.headers, extensions=extensions) as response:
+                        if response.status in RETRY_STATUSES and attempt < self.max_retries:
+                            headers = {name.lower(): value for name, value in response.headers}
+                            delay = self._retry_delay(attempt, parse_retry_after(headers.get(b"retry-after")))
+                        elif response.status >= 400:
+                            raise CFBDError(f"GET {path} {params or ''} failed with HTTP {response.status}")
+                        else:
+                            async for item in iter_json_array(response.aiter_stream()):
+                                yielded = True
+                                yield item
+                            return
+                # NetworkError covers connect failures and resets (ReadError/WriteError)
+                except (httpcore.NetworkError, httpcore.TimeoutException, httpcore.RemoteProtocolError):
+                    # A retry would repeat what the caller already has
+                    if yielded or attempt == self.max_retries:
+                        raise
+                    delay = self._retry_delay(attempt)
+                await asyncio.sleep(delay)
+
+        raise CFBDError(f"GET {path} {params or ''} failed after {self.max_retries} retries")
+
+
+async def ingest_season_records(client, season, update_teams, db_path=DB_PATH):
+    """Fetch one season's FBS records; for the live season, upsert them into the teams table.
+
+    Nothing is written until the whole body has arrived, so a dropped
+    connection leaves the table as it was (a season is ~130 rows).
+    """
+    records = [
+        record async for record in client.stream("/records", {"year": season})
+        if record.get("classification") == "fbs"
+    ]
+    if update_teams and records:
+        rows = [record_row(record) for record in records]
+        await asyncio.wrap_future(get_write_queue(db_path).submit(upsert_records, rows))
+    return records
+
+
+async def ingest_records(seasons, current_season, api_key, base_url=CFBD_BASE_URL, concurrency=8,
+                         requests_per_second=None, db_path=DB_PATH, archive=True, archive_dir=None):
+    """Fetch several seasons concurrently.
+
+    Every season's snapshot goes to the Parquet archive (next to ``db_path``
+    unless ``archive_dir`` is given); only ``current_season`` is written to
+    the teams table.
+    Returns ``{season: (fbs_records, archived_rows)}``.
+    """
+    fetched_at = datetime.now()
+    async with CFBDClient(api_key, base_url, concurrency, requests_per_second=requests_per_second) as client:
+        results = await asyncio.gather(*(
+            ingest_season_records(client, season, season == current_season, db_path=db_path)
+            for season in seasons
+        ))
+
+    archive_dir = archive_dir or archive_dir_for(db_path)
+    ingested = {}
+    for season, records in zip(seasons, results):
+        archived = archive_snapshot(records_to_frame(records), fetched_at, season, archive_dir) if archive and records else 0
+        ingested[season] = (records, archived)
+    return ingested
+
+
+if __name__ == "__main__":
+    # Usage: python ingest.py <season> [<season> ...]   (backfill into the archive)
+    api_key = os.environ.get("CFBD_API_KEY", "").strip()
+    if not api_key:
+        raise RuntimeError("Please set CFBD_API_KEY in your environment")
+
+    seasons = [int(arg) for arg in sys.argv[1:]]
+    start = time.perf_counter()
+    ingested = asyncio.run(ingest_records(seasons, current_season=None, api_key=api_key))
+    for season, (records, archived) in sorted(ingested.items()):
+        print(f"{season}: {len(records)} FBS records, {archived} archived")
+    print(f"✅ Backfilled {len(seasons)} seasons in {time.perf_counter() - start:.1f}s")
@@ -1,5 +1,8 @@
 from database import engine
 from models import Base
+from dal import ensure_schema
 
 Base.metadata.create_all(bind=engine)
+with engine.connect() as conn:
+    ensure_schema(conn.connection.driver_connection)
 print("Database Initialized")
\ No newline at end of file
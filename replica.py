@@ -0,0 +1,121 @@
+import itertools
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+from dal.pool import CACHED_STATEMENTS, DB_PATH, connect
+
+_replica_names = itertools.count(1)
+
+
+class ReadReplica:
+    """In-memory copy of the database for read-only traffic.
+
+    The copy is built with the sqlite3 backup API and rebuilt only when
+    ``PRAGMA data_version`` on a long-lived source connection changes, i.e.
+    when some other connection has committed a write to the primary file.
+    Readers borrow connections from a pool bound to the current copy; a
+    refresh builds a new copy and swaps it in, so readers never block on it.
+    """
+
+    def __init__(self, db_path=DB_PATH, pool_size=8):
+        self.db_path = db_path
+        self.pool_size = pool_size
+        self._lock = threading.Lock()
+        self._source = connect(db_path)
+        self._data_version = None
+        self._generation = None
+        self.refresh_count = 0
+        self.refresh()
+
+    def _source_version(self):
+        return self._source.execute("PRAGMA data_version").fetchone()[0]
+
+    def refresh(self):
+        """Rebuild the in-memory copy from the primary file."""
+        with self._lock:
+            old = self._refresh_locked()
+        if old:
+            self._close_generation(old)
+
+    def _refresh_locked(self):
+        uri = f"file:cfbpickem_replica_{next(_replica_names)}?mode=memory&cache=shared"
+        # The anchor connection keeps the shared in-memory database alive
+        anchor = sqlite3.connect(uri, uri=True, check_same_thread=False)
+        # Read the version first: a commit that lands during the backup then
+        # shows up as a newer version and triggers another refresh, instead
+        # of being recorded against a copy that doesn't contain it
+        self._data_version = self._source_version()
+        self._source.backup(anchor)
+        old, self._generation = self._generation, (uri, anchor, queue.SimpleQueue())
+        self.refresh_count += 1
+        return old
+
+    def refresh_if_stale(self):
+        with self._lock:
+            old, stale = self._checkout_stale()
+        if old:
+            self._close_generation(old)
+        return stale
+
+    def _checkout_stale(self):
+        # Checking and rebuilding under one lock, so concurrent readers rebuild at most once
+        if self._source_version() != self._data_version:
+            return self._refresh_locked(), True
+        return None, False
+
+    @staticmethod
+    def _close_generation(generation):
+        # Borrowed connections are closed when they are returned
+        _, anchor, idle = generation
+        while True:
+            try:
+                idle.get_nowait().close()
+            except queue.Empty:
+                break
+        anchor.close()
+
+    @contextmanager
+    def connection(self):
+        """Borrow a read-only connection to an up-to-date copy."""
+        # The connection is checked out (or opened) before the lock is released:
+        # once a refresh closes the old anchor, connecting to its URI would
+        # silently create a new, empty in-memory database
+        with self._lock:
+            old, _ = self._checkout_stale()
+            generation = self._generation
+            uri, _, idle = generation
+            try:
+                conn = idle.get_nowait()
+            except queue.Empty:
+                conn = sqlite3.connect(uri, uri=True, check_same_thread=False, cached_statements=CACHED_STATEMENTS)
+                conn.execute("PRAGMA query_only = ON")
+        if old:
+            self._close_generation(old)
+        try:
+            yield conn
+        finally:
+            if generation is self._generation and idle.qsize() < self.pool_size:
+                idle.put(conn)
+            else:
+                conn.close()
+
+    def close(self):
+        with self._lock:
+            generation, self._generation = self._generation, None
+            self._source.close()
+        if generation:
+            self._close_generation(generation)
+
+
+_replicas = {}
+_replicas_lock = threading.Lock()
+
+
+def get_replica(db_path=DB_PATH):
+    """Process-wide replica for ``db_path``, created on first use."""
+    with _replicas_lock:
+        if db_path not in _replicas:
+            _replicas[db_path] = ReadReplica(db_path)
+        return _replicas[db_path]
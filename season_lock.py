@@ -0,0 +1,216 @@
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+from datetime import datetime
+
+import numpy as np
+
+from dal import DB_PATH, connection
+from write_queue import run_write
+
+FROZEN_DIR = "frozen_picks"
+
+
+def frozen_dir_for(db_path=DB_PATH):
+    """Artifacts live next to the database they were frozen from, whatever the working directory."""
+    return os.path.join(os.path.dirname(os.path.abspath(db_path)), FROZEN_DIR)
+
+SEASON_LOCK_DDL = """
+    CREATE TABLE IF NOT EXISTS season_lock (
+        id INTEGER PRIMARY KEY CHECK (id = 1),
+        version INTEGER NOT NULL,
+        locked_at TEXT NOT NULL
+    )
+"""
+
+ARRAYS = ("player_ids", "team_ids", "pick_matrix", "team_ptr", "team_players", "fingerprints")
+
+
+class SeasonLockedError(Exception):
+    pass
+
+
+class MissingArtifactError(Exception):
+    pass
+
+
+def locked_version(conn):
+    """Version of the frozen pick artifact, or None while picks are open."""
+    try:
+        row = conn.execute("SELECT version FROM season_lock WHERE id = 1").fetchone()
+    except sqlite3.OperationalError:
+        return None
+    return row[0] if row else None
+
+
+def check_not_locked(conn):
+    if locked_version(conn) is not None:
+        raise SeasonLockedError("The season has started, picks are locked.")
+
+
+def build_pick_arrays(player_ids, team_ids, picks):
+    """Pick matrix, team -> players inverted index and per-player fingerprints.
+
+    ``picks`` is an iterable of ``(player_id, team_id)``.
+    """
+    player_ids = np.asarray(sorted(player_ids), dtype=np.int64)
+    team_ids = np.asarray(sorted(team_ids), dtype=np.int64)
+    pick_matrix = np.zeros((len(player_ids), len(team_ids)), dtype=np.uint8)
+
+    picks = np.asarray(list(picks), dtype=np.int64).reshape(-1, 2)
+    rows = np.searchsorted(player_ids, picks[:, 0])
+    cols = np.searchsorted(team_ids, picks[:, 1])
+    pick_matrix[rows, cols] = 1
+
+    # CSR layout: players who picked team j are team_players[team_ptr[j]:team_ptr[j + 1]]
+    by_team = pick_matrix.T.nonzero()
+    team_ptr = np.zeros(len(team_ids) + 1, dtype=np.int64)
+    np.cumsum(np.bincount(by_team[0], minlength=len(team_ids)), out=team_ptr[1:])
+    team_players = by_team[1].astype(np.int64)
+
+    # Identical selections share a fingerprint
+    fingerprints = np.array(
+        [
+            int.from_bytes(hashlib.blake2b(team_ids[row.nonzero()[0]].tobytes(), digest_size=8).digest(), "little")
+            for row in pick_matrix
+        ],
+        dtype=np.uint64,
+    )
+
+    return {
+        "player_ids": player_ids,
+        "team_ids": team_ids,
+        "pick_matrix": pick_matrix,
+        "team_ptr": team_ptr,
+        "team_players": team_players,
+        "fingerprints": fingerprints,
+    }
+
+
+def write_artifact(arrays, version, frozen_dir):
+    """Write one immutable artifact version; existing versions are never rewritten."""
+    path = os.path.join(frozen_dir, f"v{version}")
+    os.makedirs(path)
+
+    digest = hashlib.sha256()
+    for name in ARRAYS:
+        file_path = os.path.join(path, f"{name}.npy")
+        np.save(file_path, arrays[name])
+        digest.update(arrays[name].tobytes())
+        os.chmod(file_path, 0o444)
+
+    manifest = {
+        "version": version,
+        "frozen_at": datetime.now().isoformat(timespec="seconds"),
+        "players": len(arrays["player_ids"]),
+        "teams": len(arrays["team_ids"]),
+        "picks": int(arrays["pick_matrix"].sum()),
+        "sha256": digest.hexdigest(),
+    }
+    with open(os.path.join(path, "manifest.json"), "w") as file:
+        json.dump(manifest, file, indent=2)
+    os.chmod(os.path.join(path, "manifest.json"), 0o444)
+    return path
+
+
+def freeze_season(db_path=DB_PATH, frozen_dir=None):
+    """Lock submissions and snapshot every pick into a new artifact version.
+
+    Runs as one write-queue operation, so no pick can land between the
+    snapshot and the lock.
+    """
+    frozen_dir = frozen_dir or frozen_dir_for(db_path)
+
+    def freeze(conn):
+        conn.execute(SEASON_LOCK_DDL)
+        check_not_locked(conn)
+
+        player_ids = [row[0] for row in conn.execute("SELECT id FROM players")]
+        team_ids = [row[0] for row in conn.execute("SELECT id FROM teams")]
+        picks = conn.execute("SELECT player_id, team_id FROM player_picks").fetchall()
+
+        existing = [int(d[1:]) for d in os.listdir(frozen_dir) if d.startswith("v")] if os.path.isdir(frozen_dir) else []
+        version = max(existing, default=0) + 1
+        path = write_artifact(build_pick_arrays(player_ids, team_ids, picks), version, frozen_dir)
+
+        conn.execute(
+            "INSERT INTO season_lock (id, version, locked_at) VALUES (1, ?, ?)",
+            (version, datetime.now().isoformat(timespec="seconds")),
+        )
+        return version, path
+
+    return run_write(freeze, db_path=db_path)
+
+
+def unlock_season(db_path=DB_PATH):
+    """Reopen submissions. Frozen artifacts are kept; the next freeze writes a new version."""
+    def unlock(conn):
+        if locked_version(conn) is not None:
+            conn.execute("DELETE FROM season_lock WHERE id = 1")
+
+    run_write(unlock, db_path=db_path)
+
+
+class FrozenPicks:
+    """Read-only view of a frozen artifact; arrays are memory-mapped."""
+
+    def __init__(self, path):
+        self.path = path
+        with open(os.path.join(path, "manifest.json")) as file:
+            self.manifest = json.load(file)
+        for name in ARRAYS:
+            setattr(self, name, np.load(os.path.join(path, f"{name}.npy"), mmap_mode="r"))
+
+    def players_for_team(self, team_id):
+        j = np.searchsorted(self.team_ids, team_id)
+        if j == len(self.team_ids) or self.team_ids[j] != team_id:
+            return np.empty(0, dtype=np.int64)
+        return self.player_ids[self.team_players[self.team_ptr[j]:self.team_ptr[j + 1]]]
+
+    def team_vector(self, values_by_team_id, default=0):
+        """Align a ``{team_id: value}`` dict with the artifact's team columns."""
+        return np.array([values_by_team_id.get(int(t), default) for t in self.team_ids], dtype=np.float64)
+
+    def player_totals(self, team_values):
+        """Sum of a per-team value over each player's picks."""
+        return self.pick_matrix @ team_values
+
+
+_loaded = {}
+
+
+def load_frozen_picks(conn, db_path=DB_PATH):
+    """The artifact for the current lock, or None while picks are open.
+
+    Loaded artifacts are cached per version, so repeat calls cost one query.
+    Raises MissingArtifactError if the season is locked but its artifact is gone.
+    """
+    version = locked_version(conn)
+    if version is None:
+        return None
+    path = os.path.join(frozen_dir_for(db_path), f"v{version}")
+    if path not in _loaded:
+        if not os.path.exists(os.path.join(path, "manifest.json")):
+            raise MissingArtifactError(
+                f"The season is locked at picks version {version}, but {path} is missing. "
+                "Restore it, or unlock and freeze again."
+            )
+        _loaded[path] = FrozenPicks(path)
+    return _loaded[path]
+
+
+if __name__ == "__main__":
+    # Usage: python season_lock.py [status | freeze | unlock]
+    command = sys.argv[1] if len(sys.argv) > 1 else "status"
+    if command == "freeze":
+        version, path = freeze_season()
+        print(f"🔒 Season locked. Picks frozen as version {version} in {path}")
+    elif command == "unlock":
+        unlock_season()
+        print("🔓 Season unlocked, submissions are open again.")
+    else:
+        with connection() as conn:
+            version = locked_version(conn)
+        print(f"Locked (picks version {version})" if version else "Open for submissions")
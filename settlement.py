@@ -0,0 +1,253 @@
+import json
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from fractions import Fraction
+from typing import NamedTuple
+
+from dal import DB_PATH, get_model
+
+BUY_IN = 35
+
+# Percent of the pot per game, in payout order (see the Payouts rules tab)
+POT_SPLIT = {
+    "Main Game": 70,
+    "Rat King": 10,
+    "Conference Champ": 20,
+}
+
+RAT_KING_TIER = 1
+
+
+# Everything is keyed by player id: names are only for display and two
+# players can share one
+class Entry(NamedTuple):
+    player_id: int
+    name: str
+    points: int
+    rat_king: Fraction
+    conf_margin: int
+    total_wins: int
+    selections: frozenset
+
+
+class PotResult(NamedTuple):
+    game: str
+    amount_cents: int
+    winners: tuple  # player ids
+    reason: str
+    payouts: dict  # player id -> cents
+
+
+class Settlement(NamedTuple):
+    db_path: str
+    buy_in_cents: int
+    pot_cents: int
+    entrants: tuple  # player ids
+    removed_unpaid: tuple  # player ids
+    pots: tuple
+    payouts: dict  # player id -> cents
+    names: dict  # player id -> display name
+
+
+# Best first: fewest points / best rate / best margin, then most total wins
+GAME_KEYS = {
+    "Main Game": lambda e: (e.points, -e.total_wins),
+    "Rat King": lambda e: (-e.rat_king, -e.total_wins),
+    "Conference Champ": lambda e: (-e.conf_margin, -e.total_wins),
+}
+
+
+def build_entries(players, picks):
+    """One ``Entry`` per player from ``dal.Player`` rows and ``get_all_pick_details`` rows."""
+    by_player = {player.id: [] for player in players}
+    for player_id, team, wins, losses, _, conf_wins, conf_losses, tier in picks:
+        if player_id in by_player:
+            by_player[player_id].append((team, wins, losses, conf_wins, conf_losses, tier or 0))
+
+    entries = []
+    for player in players:
+        rows = by_player[player.id]
+        # Exact fractions so equal win rates really tie
+        rates = [Fraction(w, w + l) if w + l else Fraction(0) for _, w, l, _, _, tier in rows if tier == RAT_KING_TIER]
+        entries.append(Entry(
+            player_id=player.id,
+            name=player.name,
+            points=sum(l * tier for _, _, l, _, _, tier in rows),
+            rat_king=sum(rates) / len(rates) if rates else Fraction(0),
+            conf_margin=sum(cw - cl for _, _, _, cw, cl, _ in rows),
+            total_wins=sum(w for _, w, _, _, _, _ in rows),
+            selections=frozenset(team for team, *_ in rows),
+        ))
+    return entries
+
+
+def split_cents(amount_cents, player_ids):
+    """Split evenly; leftover cents go one each to the first ids in the given order."""
+    share, leftover = divmod(amount_cents, len(player_ids))
+    return {player_id: share + (i < leftover) for i, player_id in enumerate(player_ids)}
+
+
+def display_names(players):
+    """``{player id: name}``, adding the email (or id) where two players share a name."""
+    counts = {}
+    for player in players:
+        counts[player.name] = counts.get(player.name, 0) + 1
+    return {
+        player.id: f"{player.name} ({player.email or f'#{player.id}'})" if counts[player.name] > 1 else player.name
+        for player in players
+    }
+
+
+def settle_pot(game, amount_cents, entries):
+    if not entries:
+        return PotResult(game, amount_cents, (), "no paid entrants", {})
+
+    key = GAME_KEYS[game]
+    best = min(key(e) for e in entries)
+    winners = [e for e in entries if key(e) == best]
+    score_ties = [e for e in entries if key(e)[0] == best[0]]
+
+    if len(winners) == 1:
+        reason = "won on total wins tiebreaker" if len(score_ties) > 1 else "outright"
+    elif len({e.selections for e in winners}) == 1:
+        reason = f"{len(winners)} identical selections split the pot"
+    else:
+        reason = f"{len(winners)}-way tie on score and total wins, pot split"
+
+    # Alphabetical (ids break name ties) so leftover cents land the same way every run
+    winner_ids = tuple(e.player_id for e in sorted(winners, key=lambda e: (e.name, e.player_id)))
+    return PotResult(game, amount_cents, winner_ids, reason, split_cents(amount_cents, winner_ids))
+
+
+def settle(players, picks, buy_in=BUY_IN, db_path=DB_PATH):
+    """Settle all three pots for one league.
+
+    Unpaid players are removed before anything is scored. Amounts are in
+    whole cents and the result only depends on the inputs, so re-running a
+    settlement reproduces it exactly.
+    """
+    paid = [p for p in players if p.paid]
+    entries = build_entries(paid, picks)
+
+    buy_in_cents = round(buy_in * 100)
+    pot_cents = buy_in_cents * len(entries)
+    amounts = {game: pot_cents * pct // 100 for game, pct in POT_SPLIT.items()}
+    # Rounding leftovers stay with the first pot
+    amounts[next(iter(POT_SPLIT))] += pot_cents - sum(amounts.values())
+
+    pots = tuple(settle_pot(game, amounts[game], entries) for game in POT_SPLIT)
+    payouts = {}
+    for pot in pots:
+        for player_id, cents in pot.payouts.items():
+            payouts[player_id] = payouts.get(player_id, 0) + cents
+    assert sum(payouts.values()) == pot_cents, "payouts must add up to the pot"
+
+    names = display_names(players)
+    by_name = lambda player_id: (names[player_id], player_id)
+    return Settlement(
+        db_path=db_path,
+        buy_in_cents=buy_in_cents,
+        pot_cents=pot_cents,
+        entrants=tuple(sorted((e.player_id for e in entries), key=by_name)),
+        removed_unpaid=tuple(sorted((p.id for p in players if not p.paid), key=by_name)),
+        pots=pots,
+        payouts={player_id: payouts[player_id] for player_id in sorted(payouts, key=by_name)},
+        names=names,
+    )
+
+
+def model_pick_details(model):
+    """``dal.get_all_pick_details`` rows from the domain model.
+
+    While the season is locked the model holds the frozen picks, so payouts
+    use the same picks the standings show.
+    """
+    t, p = model.teams, model.players
+    return [
+        (p.ids[row], t.names[team], t.wins[team], t.losses[team], t.ties[team],
+         t.conf_wins[team], t.conf_losses[team], t.tier[team] or None)
+        for row in range(len(p.ids))
+        for team in model.pick_rows(row)
+    ]
+
+
+def settle_database(db_path=DB_PATH, buy_in=BUY_IN):
+    model = get_model(db_path)
+    return settle(model.player_list(), model_pick_details(model), buy_in, db_path)
+
+
+def _settle_job(job):
+    return settle_database(*job)
+
+
+def settle_many(db_paths, buy_in=BUY_IN, workers=None):
+    """Settle several leagues/seasons (one database each) in parallel."""
+    jobs = [(db_path, buy_in) for db_path in db_paths]
+    if len(jobs) == 1:
+        return [_settle_job(jobs[0])]
+    with ProcessPoolExecutor(workers) as pool:
+        return list(pool.map(_settle_job, jobs))
+
+
+def settlement_to_dict(settlement):
+    """JSON-ready audit record."""
+    def player(player_id):
+        return {"player_id": player_id, "name": settlement.names[player_id]}
+
+    def payouts(cents_by_id):
+        return [{**player(player_id), "cents": cents} for player_id, cents in cents_by_id.items()]
+
+    return {
+        "db_path": settlement.db_path,
+        "buy_in_cents": settlement.buy_in_cents,
+        "pot_cents": settlement.pot_cents,
+        "entrants": [player(player_id) for player_id in settlement.entrants],
+        "removed_unpaid": [player(player_id) for player_id in settlement.removed_unpaid],
+        "pots": [
+            {
+                "game": pot.game,
+                "percent": POT_SPLIT[pot.game],
+                "amount_cents": pot.amount_cents,
+                "winners": [player(player_id) for player_id in pot.winners],
+                "reason": pot.reason,
+                "payouts_cents": payouts(pot.payouts),
+            }
+            for pot in settlement.pots
+        ],
+        "payouts_cents": payouts(settlement.payouts),
+    }
+
+
+def format_settlement(settlement):
+    lines = [
+        f"League: {settlement.db_path}",
+        f"Buy-in ${settlement.buy_in_cents / 100:.2f} x {len(settlement.entrants)} paid = "
+        f"${settlement.pot_cents / 100:.2f}",
+    ]
+    names = settlement.names
+    if settlement.removed_unpaid:
+        lines.append(f"Removed (unpaid): {', '.join(names[i] for i in settlement.removed_unpaid)}")
+    for pot in settlement.pots:
+        winners = ", ".join(names[i] for i in pot.winners) or "-"
+        lines.append(f"{pot.game} ({POT_SPLIT[pot.game]}%, ${pot.amount_cents / 100:.2f}): {winners} [{pot.reason}]")
+    for player_id, cents in settlement.payouts.items():
+        lines.append(f"  💰 {names[player_id]}: ${cents / 100:.2f}")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    # Usage: python settlement.py [--buy-in 35] [--json] [league.db ...]
+    args = sys.argv[1:]
+    buy_in = BUY_IN
+    if "--buy-in" in args:
+        i = args.index("--buy-in")
+        buy_in = float(args[i + 1])
+        del args[i:i + 2]
+    as_json = "--json" in args
+    db_paths = [arg for arg in args if arg != "--json"] or [DB_PATH]
+
+    settlements = settle_many(db_paths, buy_in)
+    if as_json:
+        print(json.dumps([settlement_to_dict(s) for s in settlements], indent=2))
+    else:
+        print("\n\n".join(format_settlement(s) for s in settlements))
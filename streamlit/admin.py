@@ -1,15 +1,28 @@
+import json
+import os
+import sys
 import streamlit as st
-import sqlite3
 from PIL import Image
 import pandas as pd
 import altair as alt
 
-DB_PATH = "cfbpickem.db"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from dal import get_model
+from dal import writes
+from settlement import BUY_IN, display_names, format_settlement, settle_database, settlement_to_dict
+from season_lock import SeasonLockedError
+from write_queue import run_write
+
 ADMIN_PASSWORD = st.secrets["admin"]["password"]
 
-# Helper
-def get_db_connection():
-    return sqlite3.connect(DB_PATH)
+# Player and pick edits are refused once the season is frozen
+def locked_write(fn, *args):
+    try:
+        run_write(fn, *args)
+    except SeasonLockedError as e:
+        st.error(str(e))
+        return False
+    return True
 
 def check_admin_password():
     return st.session_state.get("authenticated", False)
@@ -34,92 +47,57 @@ if not check_admin_password():
     st.stop()
 
 # Tabs for admin tasks
-tab1, tab2, tab3, tab4 = st.tabs(["Update Team Stats", "Manage Picks", "Manage Players", "Users"])
+tab1, tab2, tab3, tab4, tab5 = st.tabs(["Update Team Stats", "Manage Picks", "Manage Players", "Users", "Settlement"])
 
 # --- Tab 1: Update Team Stats ---
 with tab1:
     st.subheader("📊 Edit Team Stats")
 
-    with get_db_connection() as conn:
-        cursor = conn.cursor()
-        cursor.execute("SELECT id, name FROM teams ORDER BY name")
-        teams = cursor.fetchall()
-
-    team_names = {name: id for id, name in teams}
-    selected_team = st.selectbox("Select a team", list(team_names.keys()))
+    model = get_model()
+    team_names = model.teams.id_of
+    selected_team = st.selectbox("Select a team", sorted(team_names))
 
     if selected_team:
         team_id = team_names[selected_team]
 
-        with get_db_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT wins, losses, ties, conf_wins, conf_losses, tier, preseason_rank
-                FROM teams WHERE id = ?
-            """, (team_id,))
-            row = cursor.fetchone()
-
-        wins = st.number_input("Wins", min_value=0, value=row[0])
-        losses = st.number_input("Losses", min_value=0, value=row[1])
-        ties = st.number_input("Ties", min_value=0, value=row[2])
-        conf_wins = st.number_input("Conf Wins", min_value=0, value=row[3])
-        conf_losses = st.number_input("Conf Losses", min_value=0, value=row[4])
-        tier = st.number_input("Tier (1-6)", min_value=1, max_value=6, value=row[5])
-        preseason_rank = st.number_input("Preseason Rank", min_value=1, value=row[6])
+        team = model.team(team_id)
+
+        wins = st.number_input("Wins", min_value=0, value=team.wins)
+        losses = st.number_input("Losses", min_value=0, value=team.losses)
+        ties = st.number_input("Ties", min_value=0, value=team.ties)
+        conf_wins = st.number_input("Conf Wins", min_value=0, value=team.conf_wins)
+        conf_losses = st.number_input("Conf Losses", min_value=0, value=team.conf_losses)
+        tier = st.number_input("Tier (1-6)", min_value=1, max_value=6, value=team.tier)
+        preseason_rank = st.number_input("Preseason Rank", min_value=1, value=team.preseason_rank)
 
         if st.button("Update Team Stats"):
-            with get_db_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute("""
-                    UPDATE teams SET wins=?, losses=?, ties=?, conf_wins=?, conf_losses=?, tier=?, preseason_rank=?
-                    WHERE id = ?
-                """, (wins, losses, ties, conf_wins, conf_losses, tier, preseason_rank, team_id))
-                conn.commit()
-                st.success(f"{selected_team} stats updated!")
+            run_write(writes.update_team_stats, team_id, wins, losses, ties, conf_wins, conf_losses,
+                      tier, preseason_rank)
+            st.success(f"{selected_team} stats updated!")
 
 # --- Tab 2: Manage Picks ---
 with tab2:
     st.subheader("📝 Edit Player Picks")
 
-    with get_db_connection() as conn:
-        cursor = conn.cursor()
-        cursor.execute("SELECT id, name FROM players ORDER BY name")
-        players = cursor.fetchall()
-
-    player_names = {name: id for id, name in players}
-    selected_player = st.selectbox("Select Player", list(player_names.keys()))
+    model = get_model()
+    # Keyed by id: two players can share a name, so labels add the email
+    player_labels = display_names(model.player_list())
+    player_id = st.selectbox("Select Player", list(player_labels), format_func=player_labels.get)
 
-    if selected_player:
-        player_id = player_names[selected_player]
-
-        with get_db_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT t.name FROM player_picks p
-                JOIN teams t ON p.team_id = t.id
-                WHERE p.player_id = ?
-            """, (player_id,))
-            picks = [row[0] for row in cursor.fetchall()]
+    if player_id is not None:
+        selected_player = player_labels[player_id]
+        picks = model.pick_names(player_id)
 
         st.write("Current Picks:", ", ".join(picks))
 
-        add_team = st.selectbox("Add a Team", [t for t in team_names.keys() if t not in picks])
+        add_team = st.selectbox("Add a Team", [t for t in sorted(team_names) if t not in picks])
         if st.button("Add Pick"):
-            with get_db_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute("INSERT INTO player_picks (player_id, team_id) VALUES (?, ?)",
-                               (player_id, team_names[add_team]))
-                conn.commit()
+            if locked_write(writes.add_pick, player_id, team_names[add_team]):
                 st.success(f"Added {add_team} to {selected_player}'s picks!")
 
         remove_team = st.selectbox("Remove a Team", picks)
         if st.button("Remove Pick"):
-            with get_db_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute("""
-                    DELETE FROM player_picks WHERE player_id = ? AND team_id = ?
-                """, (player_id, team_names[remove_team]))
-                conn.commit()
+            if locked_write(writes.remove_pick, player_id, team_names[remove_team]):
                 st.warning(f"Removed {remove_team} from {selected_player}'s picks.")
 
 # --- Tab 3: Manage Players ---
@@ -131,43 +109,56 @@ with tab3:
     paid = st.checkbox("Paid", value=False)
 
     if st.button("Add Player") and new_player.strip():
-        with get_db_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                "INSERT INTO players (name, email, paid) VALUES (?, ?, ?)",
-                (new_player.strip(), new_email.strip(), int(paid))
-            )
-            conn.commit()
+        if locked_write(writes.add_player, new_player.strip(), new_email.strip(), paid):
             st.success(f"Added new player: {new_player.strip()} (Paid: {paid})")
 
-    delete_player = st.selectbox("Delete Existing Player", list(player_names.keys()))
-    if st.button("Delete Player"):
-        with get_db_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("DELETE FROM player_picks WHERE player_id = (SELECT id FROM players WHERE name = ?)", (delete_player,))
-            cursor.execute("DELETE FROM players WHERE name = ?", (delete_player,))
-            conn.commit()
-            st.warning(f"Deleted player: {delete_player} and all associated picks.")
+    delete_id = st.selectbox("Delete Existing Player", list(player_labels), format_func=player_labels.get)
+    if st.button("Delete Player") and delete_id is not None:
+        if locked_write(writes.delete_player, delete_id):
+            st.warning(f"Deleted player: {player_labels[delete_id]} and all associated picks.")
 
 # --- Tab 4: Users ---
 with tab4:
     st.subheader("👥 All Users")
 
-    with get_db_connection() as conn:
-        cursor = conn.cursor()
-        cursor.execute("SELECT id, name, email, paid FROM players ORDER BY name")
-        rows = cursor.fetchall()
-
-    for player_id, name, email, paid in rows:
+    for player_id, name, email, paid in get_model().player_list():
         cols = st.columns([3, 4, 2, 2])
         cols[0].write(name)
         cols[1].write(email)
         is_paid = cols[2].checkbox("Paid", value=bool(paid), key=f"paid_{player_id}")
 
         if is_paid != bool(paid):
-            with get_db_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute("UPDATE players SET paid = ? WHERE id = ?", (int(is_paid), player_id))
-                conn.commit()
-                st.success(f"Updated {name}'s paid status to {'✅' if is_paid else '❌'}")
-                st.rerun()
+            run_write(writes.set_paid, player_id, is_paid)
+            st.success(f"Updated {name}'s paid status to {'✅' if is_paid else '❌'}")
+            st.rerun()
+
+# --- Tab 5: Settlement ---
+with tab5:
+    st.subheader("💰 End-of-Season Settlement")
+
+    buy_in = st.number_input("Buy-in ($)", min_value=0.0, value=float(BUY_IN), step=5.0)
+    if st.button("Settle Pots"):
+        settlement = settle_database(buy_in=buy_in)
+        st.session_state["settlement"] = settlement
+
+    settlement = st.session_state.get("settlement")
+    if settlement:
+        st.write(f"Pot: ${settlement.pot_cents / 100:.2f} from {len(settlement.entrants)} paid players")
+        if settlement.removed_unpaid:
+            st.warning(f"Removed (unpaid): {', '.join(settlement.names[i] for i in settlement.removed_unpaid)}")
+
+        st.table(pd.DataFrame({
+            "Game": [pot.game for pot in settlement.pots],
+            "Amount": [f"${pot.amount_cents / 100:.2f}" for pot in settlement.pots],
+            "Winners": [", ".join(settlement.names[i] for i in pot.winners) or "-" for pot in settlement.pots],
+            "Result": [pot.reason for pot in settlement.pots],
+        }))
+        st.table(pd.DataFrame({
+            "Player": [settlement.names[i] for i in settlement.payouts],
+            "Payout": [f"${cents / 100:.2f}" for cents in settlement.payouts.values()],
+        }))
+
+        st.download_button("Download Report (JSON)", json.dumps(settlement_to_dict(settlement), indent=2),
+                           file_name="settlement.json", mime="application/json")
+        st.download_button("Download Report (Text)", format_settlement(settlement),
+                           file_name="settlement.txt", mime="text/plain")
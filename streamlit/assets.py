@@ -0,0 +1,25 @@
+import os
+
+import streamlit as st
+
+ASSET_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+# Static assets are read once per process and shared by every session/rerun
+@st.cache_resource
+def read_asset(file_name):
+    with open(os.path.join(ASSET_DIR, file_name), "rb") as file:
+        return file.read()
+
+
+def logo():
+    return read_asset("white.png")
+
+
+def venmo_qr():
+    return read_asset("venmo.jpeg")
+
+
+@st.cache_resource
+def rules_markdown(section):
+    return read_asset(os.path.join("rules", f"{section}.md")).decode("utf-8")
@@ -0,0 +1,73 @@
+import streamlit as st
+import pandas as pd
+import altair as alt
+
+from dal import get_model
+
+
+# Derived once per model revision, see views/standings.py
+def team_stats(model):
+    rows = model.team_stats()
+    return {
+        "Team": [r[0] for r in rows],
+        "Record": [f"{r[1]}-{r[2]}-{r[3]}" for r in rows],
+        "Conf Record": [f"{r[4]}-{r[5]}" for r in rows],
+        "Preseason Rank": [r[6] for r in rows],
+        "Cost": [r[7] for r in rows],
+    }
+
+def pick_popularity(model):
+    df = pd.DataFrame(model.pick_popularity(), columns=["Team", "Tier", "Picks"])
+
+    # Convert database tier to player-facing tier
+    def convert_tier(db_tier):
+        return (
+            1 if db_tier == 6 else
+            2 if db_tier == 4 else
+            3 if db_tier == 3 else
+            4 if db_tier == 2 else
+            5 if db_tier == 1 else
+            db_tier
+        )
+
+    df["PlayerTier"] = df["Tier"].apply(convert_tier)
+    return df.sort_values("PlayerTier")
+
+
+def team_stats_panel():
+    st.subheader("All Teams & Stats")
+    st.dataframe(get_model().derived(team_stats), use_container_width=True)
+
+@st.fragment
+def pick_popularity_panel():
+    st.subheader("Team Pick Popularity")
+    df = get_model().derived(pick_popularity)
+    if df.empty:
+        st.info("No picks yet!")
+        return
+
+    # The tier filter reruns only this fragment
+    selected_tier = st.selectbox("Filter by Tier", sorted(df["PlayerTier"].unique()))
+    df = df[df["PlayerTier"] == selected_tier]
+
+    chart = alt.Chart(df).mark_bar().encode(
+        x=alt.X("Picks:Q", title="Number of Players"),
+        y=alt.Y("Team:N", sort='-x', title="Team"),
+        tooltip=["Team", "Picks"]
+    ).properties(height=600)
+    st.altair_chart(chart, use_container_width=True)
+
+
+PANELS = {
+    "📊 Team Stats": team_stats_panel,
+    "📈 Pick Popularity": pick_popularity_panel,
+}
+
+
+def render():
+    st.header("🏈 Team Overview")
+
+    panel = st.segmented_control(
+        "View", list(PANELS), default="📊 Team Stats", key="game_stats_panel", label_visibility="collapsed"
+    )
+    PANELS[panel or "📊 Team Stats"]()
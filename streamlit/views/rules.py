@@ -0,0 +1,41 @@
+import streamlit as st
+
+from assets import rules_markdown, venmo_qr
+
+
+def render_rule_tabs(show_main_game=True):
+    main_tab, rat_tab, conf_tab, payout_tab = st.tabs(["Main Game", "Rat King", "Conference Champ", "Payouts"])
+
+    with main_tab:
+        if show_main_game:
+            st.markdown(rules_markdown("main_game"))
+
+    with rat_tab:
+        st.header("Rat King Rules")
+        st.markdown(rules_markdown("rat_king"))
+
+    with conf_tab:
+        st.header("Conference Champ Rules")
+        st.markdown(rules_markdown("conference_champ"))
+
+    with payout_tab:
+        st.header("Buy-In & Payouts")
+        st.markdown(rules_markdown("payouts"))
+
+        st.table({
+            "Game": ["Main Game", "Rat King", "Conference Champ"],
+            "Prize Split": ["70%", "10%", "20%"]
+        })
+
+        st.image(venmo_qr(), use_container_width=True)
+        st.markdown("""
+        <div style="text-align: center;">
+            <a href="https://venmo.com/code?user_id=1944273914167296153" target="_blank">Venmo Payment Link</a>
+        </div>
+        """, unsafe_allow_html=True)
+
+
+def render():
+    st.header("📜 Rules")
+    st.subheader("Cycle Through Tabs to Check Side-Pot Games & Buy-In/Payouts")
+    render_rule_tabs()
@@ -0,0 +1,138 @@
+import streamlit as st
+
+from dal import compute_ranks, get_model
+
+
+# Each standings table is derived once per model revision and shared by
+# every session, so reruns between writes cost a dictionary lookup
+def main_game_standings(model):
+    t, p = model.teams, model.players
+    standings = []
+    for rank, name, pts, player_id in compute_ranks(model.player_points(), reverse=False):
+        row = p.row_of[player_id]
+        teams = [
+            (t.names[team], f"{t.wins[team]}-{t.losses[team]}-{t.ties[team]}", t.tier[team] or None,
+             t.losses[team] * t.tier[team])
+            for team in model.pick_rows(row)
+        ]
+        standings.append((rank, name, pts, teams))
+    return standings
+
+def rat_king_standings(model):
+    return compute_ranks(model.rat_king_scores(), reverse=True)
+
+def conference_champ_standings(model):
+    return compute_ranks(model.conference_champ_scores(), reverse=True)
+
+def hindsight(model):
+    # numpy (via hindsight.py) is only loaded once someone opens this panel
+    from hindsight import hindsight_report
+
+    return hindsight_report(model)
+
+
+# Panels are fragments: changing a panel's player filter reruns only that panel
+@st.fragment
+def main_game_panel():
+    ranked_players = get_model().derived(main_game_standings)
+
+    all_player_names = [name for _, name, _, _ in ranked_players]
+    selected = st.selectbox("Select Player (or view all)", ["All"] + all_player_names)
+
+    for rank, name, pts, teams in ranked_players:
+        if selected != "All" and selected != name:
+            continue
+        with st.expander(f"#{rank} {name} - {pts} pts"):
+            for team, record, tier, team_points in teams:
+                player_tier = (
+                    1 if tier == 6 else
+                    2 if tier == 4 else
+                    3 if tier == 3 else
+                    4 if tier == 2 else
+                    5 if tier == 1 else
+                    tier
+                )
+                st.markdown(f"{team} [Tier {player_tier}] ({record}) → {team_points} pts")
+
+@st.fragment
+def rat_king_panel():
+    st.subheader("Rat King Standings (Avg Win Rate of Tier 5 Picks)")
+    ranked_scores = get_model().derived(rat_king_standings)
+
+    all_names = [name for _, name, _, _, _ in ranked_scores]
+    selected = st.selectbox("Select Player (or view all)", ["All"] + all_names, key="rat_king")
+
+    for rank, name, score, details, _ in ranked_scores:
+        if selected != "All" and selected != name:
+            continue
+
+        with st.expander(f"#{rank} {name} — Avg Win Rate: {score:.3%}"):
+            for team_name, wins, losses in details:
+                total = wins + losses
+                rate = wins / total if total else 0
+                st.write(f"{team_name}: {wins}-{losses} ({rate:.1%})")
+
+@st.fragment
+def conference_champ_panel():
+    st.subheader("Conference Champ Standings (Conf Wins - Conf Losses)")
+    ranked_champs = get_model().derived(conference_champ_standings)
+
+    all_names = [name for _, name, _, _, _ in ranked_champs]
+    selected = st.selectbox("Select Player (or view all)", ["All"] + all_names, key="conf_champ")
+
+    for rank, name, margin, data, _ in ranked_champs:
+        if selected != "All" and selected != name:
+            continue
+
+        with st.expander(f"#{rank} {name} — Conf Margin: {margin}"):
+            for team_name, conf_wins, conf_losses in data:
+                st.write(f"{team_name}: {conf_wins}-{conf_losses}")
+
+@st.fragment
+def best_possible_panel():
+    st.subheader("Best Possible Picks (in hindsight)")
+    frontier, gaps, team_names = get_model().derived(hindsight)
+    if not frontier:
+        st.info("Not enough tiered teams to build a lineup yet!")
+        return
+
+    best = frontier[0]
+    st.markdown(f"**{best.points} pts** · Rat King {float(best.rat_king):.1%} · Conf Margin {best.conf_margin:+d}")
+    st.write(", ".join(team_names[team_id] for team_id in best.team_ids))
+
+    st.caption("Lineups no other lineup beats in all three games at once")
+    st.dataframe({
+        "Points": [l.points for l in frontier],
+        "Rat King": [f"{float(l.rat_king):.1%}" for l in frontier],
+        "Conf Margin": [l.conf_margin for l in frontier],
+        "Teams": [", ".join(team_names[team_id] for team_id in l.team_ids) for l in frontier],
+    }, hide_index=True, use_container_width=True)
+
+    if gaps:
+        st.caption("How far each player is from the best possible in each game")
+        st.dataframe({
+            "Player": [g.name for g in gaps],
+            "Pts Behind": [g.points_gap for g in gaps],
+            "Rat King Behind": [f"{float(g.rat_king_gap):.1%}" for g in gaps],
+            "Conf Margin Behind": [g.conf_margin_gap for g in gaps],
+            "Optimal Trade-off": ["⭐" if not g.dominated else "" for g in gaps],
+        }, hide_index=True, use_container_width=True)
+
+
+PANELS = {
+    "Main Game": main_game_panel,
+    "Rat King": rat_king_panel,
+    "Conference Champ": conference_champ_panel,
+    "Best Possible": best_possible_panel,
+}
+
+
+def render():
+    st.header("🏆 Standings")
+
+    # st.tabs runs every tab body on each rerun; a segmented control only
+    # runs the panel that is actually showing
+    panel = st.segmented_control(
+        "Game", list(PANELS), default="Main Game", key="standings_panel", label_visibility="collapsed"
+    )
+    PANELS[panel or "Main Game"]()
@@ -0,0 +1,25 @@
+import os
+import sqlite3
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    """A fresh database with the models.py schema and the change log installed."""
+    from sqlalchemy import create_engine
+
+    from dal import ensure_schema
+    from models import Base
+
+    path = str(tmp_path / "cfbpickem.db")
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+    engine.dispose()
+    conn = sqlite3.connect(path)
+    ensure_schema(conn)
+    conn.close()
+    return path
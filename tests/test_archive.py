@@ -0,0 +1,43 @@
+import sqlite3
+from datetime import datetime
+
+import pandas as pd
+
+from archive import RECORD_COLUMNS, archive_snapshot, import_csv_backups, latest_records, standings_as_of
+
+
+def frame(rows):
+    return pd.DataFrame(rows, columns=RECORD_COLUMNS)
+
+
+def test_only_changed_rows_are_archived(tmp_path):
+    archive_dir = str(tmp_path / "archive")
+    first = frame([("Navy", 1, 0, 0, 1, 0), ("Army", 0, 1, 0, 0, 1)])
+    assert archive_snapshot(first, datetime(2025, 9, 1), 2025, archive_dir) == 2
+    second = frame([("Navy", 2, 0, 0, 1, 0), ("Army", 0, 1, 0, 0, 1)])
+    assert archive_snapshot(second, datetime(2025, 9, 8), 2025, archive_dir) == 1
+
+    assert latest_records(2025, datetime(2025, 9, 2), archive_dir)["wins"].tolist() == [0, 1]
+    assert latest_records(2025, archive_dir=archive_dir)["wins"].tolist() == [0, 2]
+
+
+def test_january_backups_belong_to_the_next_year(tmp_path):
+    archive_dir = str(tmp_path / "archive")
+    path = tmp_path / "record_01_02_12_00.csv"
+    pd.DataFrame([("Navy", 11, 2, 0, 7, 1)], columns=RECORD_COLUMNS).to_csv(path, index=False)
+    assert import_csv_backups([str(path)], 2025, archive_dir) == 1
+    assert latest_records(2025, archive_dir=archive_dir)["fetched_at"][0] == pd.Timestamp(2026, 1, 2, 12)
+
+
+def test_players_sharing_a_name_keep_their_own_points(db_path, tmp_path):
+    conn = sqlite3.connect(db_path)
+    with conn:
+        conn.executemany("INSERT INTO teams (id, name, tier) VALUES (?, ?, ?)", [(1, "Navy", 2), (2, "Army", 1)])
+        conn.executemany("INSERT INTO players (id, name, email) VALUES (?, 'Mike', ?)", [(1, "a@x"), (2, "b@x")])
+        conn.executemany("INSERT INTO player_picks (player_id, team_id) VALUES (?, ?)", [(1, 1), (2, 2)])
+    conn.close()
+    archive_dir = str(tmp_path / "archive")
+    archive_snapshot(frame([("Navy", 5, 3, 0, 0, 0), ("Army", 7, 1, 0, 0, 0)]), datetime(2025, 9, 1), 2025, archive_dir)
+
+    standings = standings_as_of(datetime(2025, 9, 2), 2025, archive_dir, db_path=db_path)
+    assert standings == [(2, "Mike", 1), (1, "Mike", 6)]
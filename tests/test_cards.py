@@ -0,0 +1,33 @@
+import os
+import sqlite3
+
+from cards import generate_cards
+
+
+def test_cards_render_next_to_the_database_from_any_directory(db_path, tmp_path, monkeypatch):
+    conn = sqlite3.connect(db_path)
+    with conn:
+        conn.execute("INSERT INTO teams (id, name, wins, losses, ties, conf_wins, conf_losses, tier) "
+                     "VALUES (1, 'Navy', 5, 3, 0, 3, 1, 1)")
+        conn.executemany("INSERT INTO players (id, name, email) VALUES (?, ?, ?)", [(1, "Mike", "a@x"), (2, "Zoe", "z@x")])
+        conn.executemany("INSERT INTO player_picks (player_id, team_id) VALUES (?, 1)", [(1,), (2,)])
+    conn.close()
+    elsewhere = tmp_path / "elsewhere"
+    elsewhere.mkdir()
+    monkeypatch.chdir(elsewhere)
+
+    written = generate_cards(2025, workers=1, db_path=db_path)
+    cards_dir = os.path.join(os.path.dirname(db_path), "cards")
+    assert sorted(os.path.basename(path) for path in written) == [
+        "leaderboard_2025_week_20.png", "player_1.png", "player_2.png",
+    ]
+    assert os.listdir(elsewhere) == []
+
+    conn = sqlite3.connect(db_path)
+    with conn:
+        conn.execute("DELETE FROM player_picks WHERE player_id = 2")
+        conn.execute("DELETE FROM players WHERE id = 2")
+    conn.close()
+    generate_cards(2025, workers=1, db_path=db_path)
+    assert not os.path.exists(os.path.join(cards_dir, "player_2.png"))
+    assert os.path.exists(os.path.join(cards_dir, "player_1.png"))
@@ -0,0 +1,113 @@
+import asyncio
+import os
+import sqlite3
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import httpcore
+import pytest
+
+from cfbd_stub import StubCFBD
+from ingest import CFBDClient, ingest_records, ingest_season_records, parse_retry_after
+
+
+async def fetch(stub, **client_kwargs):
+    items = []
+    async with stub:
+        async with CFBDClient("test", stub.base_url, backoff=0, **client_kwargs) as client:
+            async for record in client.stream("/records", {"year": 2025}):
+                items.append(record["team"])
+    return items, client.request_count
+
+
+def test_chunked_body_is_decoded_in_order():
+    items, requests = asyncio.run(fetch(StubCFBD(teams=5, chunk_size=7)))
+    assert items == ["T0", "T1", "T2", "T3", "T4"]
+    assert requests == 1
+
+
+def test_429_is_retried_with_lowercase_retry_after():
+    stub = StubCFBD(teams=5, fail_first=2, retry_after="0", retry_after_header=b"retry-after")
+    items, requests = asyncio.run(fetch(stub))
+    assert items == ["T0", "T1", "T2", "T3", "T4"]
+    assert requests == 3
+
+
+def test_reset_before_any_bytes_is_retried():
+    items, requests = asyncio.run(fetch(StubCFBD(teams=5, reset_first=2)))
+    assert items == ["T0", "T1", "T2", "T3", "T4"]
+    assert requests == 3
+
+
+def test_mid_stream_drop_is_not_retried():
+    stub = StubCFBD(teams=5, chunk_size=16, drop_first=1, drop_after=3)
+    items = []
+
+    async def run():
+        async with stub:
+            async with CFBDClient("test", stub.base_url, backoff=0) as client:
+                async for record in client.stream("/records", {"year": 2025}):
+                    items.append(record["team"])
+
+    with pytest.raises(httpcore.RemoteProtocolError):
+        asyncio.run(run())
+    assert items == ["T0", "T1", "T2"]
+
+
+def test_retry_after_forms_and_clamp():
+    assert parse_retry_after(b"2.5") == 2.5
+    assert parse_retry_after(b"soon") is None
+    later = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=30), usegmt=True).encode()
+    assert 25 < parse_retry_after(later) <= 30
+
+    client = CFBDClient("test", max_delay=10)
+    assert client._retry_delay(0, 3600) == 10
+    assert client._retry_delay(0, -5) == 0
+
+
+def test_dropped_season_leaves_teams_untouched(db_path):
+    conn = sqlite3.connect(db_path)
+    with conn:
+        conn.executemany("INSERT INTO teams (name, wins, losses) VALUES (?, 0, 0)", [(f"T{i}",) for i in range(5)])
+    conn.close()
+    stub = StubCFBD(teams=5, chunk_size=16, drop_first=1, drop_after=3)
+
+    async def run():
+        async with stub:
+            async with CFBDClient("test", stub.base_url, backoff=0) as client:
+                await ingest_season_records(client, 2025, update_teams=True, db_path=db_path)
+
+    with pytest.raises(httpcore.RemoteProtocolError):
+        asyncio.run(run())
+    conn = sqlite3.connect(db_path)
+    assert conn.execute("SELECT SUM(wins) FROM teams").fetchone()[0] == 0
+    conn.close()
+
+
+def test_complete_season_is_upserted(db_path):
+    stub = StubCFBD(teams=5)
+
+    async def run():
+        async with stub:
+            async with CFBDClient("test", stub.base_url, backoff=0) as client:
+                return await ingest_season_records(client, 2025, update_teams=True, db_path=db_path)
+
+    records = asyncio.run(run())
+    conn = sqlite3.connect(db_path)
+    rows = conn.execute("SELECT name, wins, losses FROM teams ORDER BY name").fetchall()
+    conn.close()
+    assert rows == [(r["team"], r["total"]["wins"], r["total"]["losses"]) for r in records]
+
+
+def test_snapshot_is_archived_next_to_the_database(db_path, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path / "..")
+    stub = StubCFBD(teams=5)
+
+    async def run():
+        async with stub:
+            return await ingest_records([2025], 2025, "test", stub.base_url, db_path=db_path)
+
+    records, archived = asyncio.run(run())[2025]
+    assert archived == len(records) == 5
+    season_dir = os.path.join(os.path.dirname(db_path), "archive", "records", "season=2025")
+    assert os.path.isdir(season_dir)
@@ -0,0 +1,113 @@
+import sqlite3
+
+import pytest
+
+import dal.model
+import dal.pool
+from dal import get_model, writes
+from dal.model import load_model
+from season_lock import freeze_season, locked_version, unlock_season
+
+
+@pytest.fixture(params=[False, True], ids=["pool", "replica"])
+def league(request, db_path, monkeypatch):
+    """A small league; reads go through the pool or the in-memory replica."""
+    monkeypatch.setattr(dal.pool, "USE_READ_REPLICA", request.param)
+    conn = sqlite3.connect(db_path)
+    with conn:
+        conn.executemany(
+            "INSERT INTO teams (id, name, wins, losses, ties, conf_wins, conf_losses, tier) VALUES (?, ?, ?, ?, 0, ?, ?, ?)",
+            [(1, "Navy", 9, 3, 6, 2, 1), (2, "Army", 8, 4, 5, 3, 1), (3, "Ohio State", 11, 1, 8, 1, 6)],
+        )
+        writes.save_picks(conn, "Mike", "a@x", [1, 3])
+        writes.save_picks(conn, "Mike", "b@x", [2])
+    yield conn
+    conn.close()
+
+
+def snapshot(model):
+    """Everything the pages read from a model."""
+    return (
+        model.team_list(),
+        model.player_list(),
+        {player.id: sorted(model.pick_names(player.id)) for player in model.player_list()},
+        sorted(model.player_points(), key=lambda row: row[2]),
+        sorted(model.rat_king_scores(), key=lambda row: row[3]),
+        sorted(model.conference_champ_scores(), key=lambda row: row[3]),
+    )
+
+
+def reloaded(db_path):
+    conn = sqlite3.connect(db_path)
+    try:
+        return load_model(conn, locked_version(conn), db_path)
+    finally:
+        conn.close()
+
+
+@pytest.fixture
+def full_loads(monkeypatch):
+    """Counts the full reloads get_model falls back to."""
+    calls = []
+
+    def counting(*args, **kwargs):
+        calls.append(args)
+        return load_model(*args, **kwargs)
+
+    monkeypatch.setattr(dal.model, "load_model", counting)
+    return calls
+
+
+def assert_matches_reload(db_path):
+    assert snapshot(get_model(db_path)) == snapshot(reloaded(db_path))
+
+
+def test_incremental_changes_match_a_full_reload(db_path, league, full_loads):
+    conn = league
+    assert_matches_reload(db_path)
+    assert len(full_loads) == 1
+
+    with conn:  # insert
+        conn.execute("INSERT INTO teams (id, name, wins, losses, ties, conf_wins, conf_losses, tier) "
+                     "VALUES (4, 'Tulane', 7, 5, 0, 4, 4, 2)")
+        zoe = writes.add_player(conn, "Zoe", "z@x")
+        writes.add_pick(conn, zoe, 4)
+    assert_matches_reload(db_path)
+
+    with conn:  # update
+        writes.update_team_stats(conn, 1, 10, 3, 0, 7, 2, 1, 12)
+        writes.save_picks(conn, "Michael", "b@x", [1, 4])
+        writes.set_paid(conn, zoe, True)
+    assert_matches_reload(db_path)
+
+    with conn:  # delete a pick
+        writes.remove_pick(conn, 1, 3)
+    assert_matches_reload(db_path)
+    assert len(full_loads) == 1
+
+    with conn:  # deleted players and teams are handled by a reload
+        writes.delete_player(conn, zoe)
+        conn.execute("DELETE FROM teams WHERE id = 3")
+    assert_matches_reload(db_path)
+    assert len(full_loads) == 2
+
+
+def test_lock_transitions_match_a_full_reload(db_path, league):
+    conn = league
+    freeze_season(db_path)
+    locked = get_model(db_path)
+    assert locked.frozen is not None
+    assert_matches_reload(db_path)
+
+    # Records still move while locked; a pick edit behind the lock's back doesn't count
+    with conn:
+        writes.update_team_stats(conn, 2, 8, 5, 0, 5, 4, 1, None)
+        conn.execute("INSERT INTO player_picks (player_id, team_id) VALUES (2, 1)")
+    assert get_model(db_path).pick_names(2) == ["Army"]
+    assert_matches_reload(db_path)
+
+    unlock_season(db_path)
+    unlocked = get_model(db_path)
+    assert unlocked.frozen is None
+    assert sorted(unlocked.pick_names(2)) == ["Army", "Navy"]
+    assert_matches_reload(db_path)
@@ -0,0 +1,66 @@
+import sqlite3
+
+from replica import ReadReplica
+
+
+def set_wins(db_path, wins):
+    conn = sqlite3.connect(db_path)
+    with conn:
+        conn.execute("UPDATE teams SET wins = ? WHERE name = 'Navy'", (wins,))
+    conn.close()
+
+
+def replica_wins(replica):
+    with replica.connection() as conn:
+        return conn.execute("SELECT wins FROM teams WHERE name = 'Navy'").fetchone()[0]
+
+
+def test_replica_sees_writes_to_the_primary(db_path):
+    conn = sqlite3.connect(db_path)
+    with conn:
+        conn.execute("INSERT INTO teams (name, wins, losses) VALUES ('Navy', 1, 0)")
+    conn.close()
+
+    replica = ReadReplica(db_path)
+    try:
+        assert replica_wins(replica) == 1
+        set_wins(db_path, 7)
+        assert replica_wins(replica) == 7
+        assert replica_wins(replica) == 7
+    finally:
+        replica.close()
+
+
+def test_commit_during_a_refresh_is_not_lost(db_path, monkeypatch):
+    conn = sqlite3.connect(db_path)
+    with conn:
+        conn.execute("INSERT INTO teams (name, wins, losses) VALUES ('Navy', 50, 0)")
+    conn.close()
+    replica = ReadReplica(db_path)
+
+    # Commit from another connection while the copy is being taken
+    backup = sqlite3.Connection.backup
+    sneaked = []
+
+    class Source:
+        def __init__(self, conn):
+            self._conn = conn
+
+        def __getattr__(self, name):
+            return getattr(self._conn, name)
+
+        def backup(self, target):
+            backup(self._conn, target)
+            if not sneaked:
+                sneaked.append(True)
+                set_wins(db_path, 99)
+
+    monkeypatch.setattr(replica, "_source", Source(replica._source))
+    try:
+        set_wins(db_path, 60)
+        assert replica_wins(replica) == 60
+        assert sneaked
+        assert replica_wins(replica) == 99
+    finally:
+        monkeypatch.undo()
+        replica.close()
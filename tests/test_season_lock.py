@@ -0,0 +1,80 @@
+import os
+import shutil
+import sqlite3
+
+import pytest
+
+from dal import writes
+from season_lock import (
+    MissingArtifactError,
+    SeasonLockedError,
+    freeze_season,
+    frozen_dir_for,
+    load_frozen_picks,
+    unlock_season,
+)
+from write_queue import run_write
+
+
+@pytest.fixture
+def league(db_path):
+    conn = sqlite3.connect(db_path)
+    with conn:
+        conn.executemany("INSERT INTO teams (id, name, tier) VALUES (?, ?, 1)", [(1, "Navy"), (2, "Army")])
+        player_id = writes.save_picks(conn, "Mike", "a@x", [1])
+    conn.close()
+    return player_id
+
+
+def artifact_files(path):
+    contents = {}
+    for name in sorted(os.listdir(path)):
+        with open(os.path.join(path, name), "rb") as file:
+            contents[name] = (file.read(), os.stat(file.fileno()).st_mtime_ns)
+    return contents
+
+
+def test_freeze_writes_v1_next_to_the_database(db_path, league):
+    version, path = freeze_season(db_path)
+    assert version == 1
+    assert path == os.path.join(os.path.dirname(db_path), "frozen_picks", "v1")
+    assert os.path.exists(os.path.join(path, "manifest.json"))
+
+
+def test_pick_and_player_changes_are_refused_once_frozen(db_path, league):
+    freeze_season(db_path)
+
+    with pytest.raises(SeasonLockedError):
+        run_write(writes.save_picks, "Mike", "a@x", [2], db_path=db_path)
+    with pytest.raises(SeasonLockedError):
+        run_write(writes.add_pick, league, 2, db_path=db_path)
+    with pytest.raises(SeasonLockedError):
+        run_write(writes.delete_player, league, db_path=db_path)
+
+    conn = sqlite3.connect(db_path)
+    assert conn.execute("SELECT player_id, team_id FROM player_picks").fetchall() == [(league, 1)]
+    conn.close()
+
+
+def test_refreeze_writes_v2_and_keeps_v1(db_path, league):
+    _, v1 = freeze_season(db_path)
+    before = artifact_files(v1)
+
+    unlock_season(db_path)
+    run_write(writes.add_pick, league, 2, db_path=db_path)
+    version, v2 = freeze_season(db_path)
+
+    assert version == 2
+    assert v2 == os.path.join(frozen_dir_for(db_path), "v2")
+    assert artifact_files(v1) == before
+    assert artifact_files(v2)["manifest.json"] != before["manifest.json"]
+
+
+def test_missing_artifact_is_reported(db_path, league):
+    _, path = freeze_season(db_path)
+    shutil.rmtree(path)
+
+    conn = sqlite3.connect(db_path)
+    with pytest.raises(MissingArtifactError, match="v1"):
+        load_frozen_picks(conn, db_path)
+    conn.close()
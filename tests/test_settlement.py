@@ -0,0 +1,75 @@
+import sqlite3
+
+from dal import Player
+from season_lock import freeze_season
+from settlement import format_settlement, settle, settle_database, settlement_to_dict
+
+
+def pick(player_id, team, wins, losses, tier, conf_wins=0, conf_losses=0):
+    return (player_id, team, wins, losses, None, conf_wins, conf_losses, tier)
+
+
+def test_players_sharing_a_name_are_paid_separately():
+    players = [
+        Player(1, "Mike", "mike.a@example.com", True),
+        Player(2, "Mike", "mike.b@example.com", True),
+        Player(3, "Zoe", None, True),
+    ]
+    picks = [
+        pick(1, "Navy", 10, 2, 1), pick(2, "Army", 10, 2, 1),
+        pick(3, "UNLV", 6, 6, 1, conf_wins=8),
+    ]
+
+    settlement = settle(players, picks, buy_in=35)
+
+    assert settlement.pot_cents == 10500
+    main_game, rat_king, conference_champ = settlement.pots
+    assert main_game.winners == (1, 2)
+    assert main_game.payouts == {1: 3675, 2: 3675}
+    assert rat_king.payouts == {1: 525, 2: 525}
+    assert conference_champ.payouts == {3: 2100}
+    assert settlement.payouts == {1: 4200, 2: 4200, 3: 2100}
+    assert sum(settlement.payouts.values()) == settlement.pot_cents
+
+    assert settlement.names[1] == "Mike (mike.a@example.com)"
+    assert settlement.names[3] == "Zoe"
+    assert "Mike (mike.b@example.com): $42.00" in format_settlement(settlement)
+    assert settlement_to_dict(settlement)["payouts_cents"][1] == {
+        "player_id": 2, "name": "Mike (mike.b@example.com)", "cents": 4200,
+    }
+
+
+def test_unpaid_players_are_removed_and_odd_cents_go_first():
+    players = [Player(1, "Bo", None, True), Player(2, "Al", None, True), Player(3, "Cy", None, False)]
+    picks = [pick(1, "Navy", 10, 2, 1), pick(2, "Army", 10, 2, 1), pick(3, "UNLV", 12, 0, 1)]
+
+    settlement = settle(players, picks, buy_in=0.05)
+
+    assert settlement.removed_unpaid == (3,)
+    assert settlement.entrants == (2, 1)
+    assert settlement.pot_cents == 10
+    # Main Game gets 7 cents: the odd cent goes to the first name alphabetically
+    assert settlement.pots[0].payouts == {2: 4, 1: 3}
+    assert sum(settlement.payouts.values()) == settlement.pot_cents
+
+
+def test_locked_season_is_settled_from_the_frozen_picks(db_path):
+    conn = sqlite3.connect(db_path)
+    with conn:
+        conn.executemany("INSERT INTO teams (id, name, wins, losses, tier) VALUES (?, ?, ?, ?, 1)",
+                         [(1, "Navy", 10, 2), (2, "Army", 2, 10)])
+        conn.executemany("INSERT INTO players (id, name, email, paid) VALUES (?, ?, ?, 1)",
+                         [(1, "Al", "al@x"), (2, "Bo", "bo@x")])
+        conn.executemany("INSERT INTO player_picks (player_id, team_id) VALUES (?, ?)", [(1, 1), (2, 2)])
+    conn.close()
+    freeze_season(db_path)
+
+    # An edit that slipped past the lock must not change who gets paid
+    conn = sqlite3.connect(db_path)
+    with conn:
+        conn.execute("UPDATE player_picks SET team_id = 1 WHERE player_id = 2")
+    conn.close()
+
+    settlement = settle_database(db_path)
+    assert settlement.pots[0].winners == (1,)
+    assert settlement.payouts == {1: 7000}
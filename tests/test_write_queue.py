@@ -0,0 +1,107 @@
+import os
+import sqlite3
+import threading
+import time
+
+import pytest
+
+from write_queue import WriteQueue, get_write_queue, run_write
+
+
+def insert(conn, name):
+    return conn.execute("INSERT INTO teams (name) VALUES (?)", (name,)).lastrowid
+
+
+def team_names(db_path):
+    conn = sqlite3.connect(db_path)
+    try:
+        return [row[0] for row in conn.execute("SELECT name FROM teams ORDER BY name")]
+    finally:
+        conn.close()
+
+
+def batch(writer, *ops):
+    """Submit ``ops`` so they share one batch: right after a commit the writer
+    waits ``commit_interval`` for more work before starting the next one."""
+    writer.submit(lambda conn: None).result()
+    return [writer.submit(fn, *args) for fn, *args in ops]
+
+
+@pytest.fixture
+def writer(db_path):
+    writer = WriteQueue(db_path, commit_interval=0.5)
+    yield writer
+    writer.close()
+
+
+def test_failing_operation_only_rolls_back_itself(db_path, writer):
+    def insert_then_fail(conn):
+        insert(conn, "Army")
+        raise ValueError("bad pick")
+
+    first, failing, last = batch(writer, (insert, "Navy"), (insert_then_fail,), (insert, "Tulane"))
+
+    assert first.result() and last.result()
+    with pytest.raises(ValueError, match="bad pick"):
+        failing.result()
+    assert team_names(db_path) == ["Navy", "Tulane"]
+    assert writer.commit_count == 2
+
+
+def test_operation_that_commits_abandons_its_batch(db_path, writer):
+    def commit(conn):
+        conn.execute("COMMIT")
+
+    earlier, committing, later = batch(writer, (insert, "Navy"), (commit,), (insert, "Tulane"))
+
+    with pytest.raises(sqlite3.OperationalError, match="ended the batch transaction"):
+        committing.result()
+    with pytest.raises(sqlite3.OperationalError, match="may not have been saved"):
+        earlier.result()
+    # Operations that hadn't started yet run in a fresh transaction
+    assert later.result()
+    assert "Tulane" in team_names(db_path)
+
+    assert writer.alive
+    assert writer.submit(insert, "Army").result()
+    assert "Army" in team_names(db_path)
+
+
+def test_writer_that_cannot_open_its_database_fails_futures(tmp_path):
+    db_path = str(tmp_path / "missing" / "cfbpickem.db")
+    writer = get_write_queue(db_path)
+    with pytest.raises(sqlite3.OperationalError):
+        writer.submit(insert, "Navy").result(timeout=5)
+    writer._thread.join(timeout=5)
+    assert not writer.alive
+    with pytest.raises(sqlite3.OperationalError):
+        writer.submit(insert, "Navy").result(timeout=5)
+
+    # Once the database can be opened, the next caller gets a working writer
+    os.makedirs(os.path.dirname(db_path))
+    assert run_write(lambda conn: conn.execute("CREATE TABLE teams (name TEXT)").rowcount, db_path=db_path, timeout=5) == -1
+    assert get_write_queue(db_path) is not writer
+    get_write_queue(db_path).close()
+
+
+def test_commit_rate_is_bounded_under_concurrent_submits(db_path):
+    writer = WriteQueue(db_path, commit_interval=0.05)
+    threads, per_thread = 16, 50
+
+    def submit_many(t):
+        futures = [writer.submit(insert, f"T{t}-{i}") for i in range(per_thread)]
+        for future in futures:
+            future.result()
+
+    start = time.monotonic()
+    workers = [threading.Thread(target=submit_many, args=(t,)) for t in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    elapsed = time.monotonic() - start
+    writer.close()
+
+    assert len(team_names(db_path)) == threads * per_thread
+    assert writer.commit_count <= elapsed / writer.commit_interval + 2
+    assert writer.commit_count < threads * per_thread / 10
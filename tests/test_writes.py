@@ -0,0 +1,19 @@
+import sqlite3
+
+from dal import writes
+
+
+def test_delete_player_removes_only_that_player(db_path):
+    conn = sqlite3.connect(db_path)
+    with conn:
+        conn.execute("INSERT INTO teams (id, name) VALUES (1, 'Navy')")
+        first = writes.add_player(conn, "Mike", "a@x")
+        second = writes.add_player(conn, "Mike", "b@x")
+        writes.add_pick(conn, first, 1)
+        writes.add_pick(conn, second, 1)
+    with conn:
+        writes.delete_player(conn, second)
+
+    assert conn.execute("SELECT id FROM players").fetchall() == [(first,)]
+    assert conn.execute("SELECT player_id FROM player_picks").fetchall() == [(first,)]
+    conn.close()
@@ -0,0 +1,192 @@
+import queue
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future
+
+from dal import DB_PATH, connect, ensure_schema
+
+_STOP = object()
+
+
+class WriteQueue:
+    """Single writer thread that group-commits queued write operations.
+
+    Callers ``submit(fn, *args)`` where ``fn(conn, *args)`` performs its
+    writes on the writer's connection, and get back a Future with ``fn``'s
+    return value. Everything queued within ``commit_interval`` of the last
+    commit shares one transaction, so the commit (fsync) rate stays at or
+    below ``1 / commit_interval`` no matter how many callers there are.
+    Each operation runs in its own savepoint: a failing operation is rolled
+    back and gets the exception without affecting the rest of the batch.
+    """
+
+    def __init__(self, db_path=DB_PATH, commit_interval=0.05, max_batch=500):
+        self.db_path = db_path
+        self.commit_interval = commit_interval
+        self.max_batch = max_batch
+        self.commit_count = 0
+        self._queue = queue.SimpleQueue()
+        self._last_commit = 0.0
+        self._error = None
+        self._state_lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name="cfbpickem-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, fn, *args):
+        future = Future()
+        with self._state_lock:
+            if self._error is not None:
+                future.set_exception(self._error)
+            else:
+                self._queue.put((future, fn, args))
+        return future
+
+    @property
+    def alive(self):
+        return self._thread.is_alive()
+
+    def execute(self, sql, params=()):
+        """Queue a single statement; the Future resolves to ``(lastrowid, rowcount)``."""
+        def run(conn):
+            cursor = conn.execute(sql, params)
+            return cursor.lastrowid, cursor.rowcount
+        return self.submit(run)
+
+    def close(self):
+        """Flush everything already queued and stop the writer thread."""
+        self._queue.put(_STOP)
+        self._thread.join()
+
+    def _next_batch(self):
+        batch = [self._queue.get()]
+        deadline = self._last_commit + self.commit_interval
+        while len(batch) < self.max_batch and batch[-1] is not _STOP:
+            try:
+                remaining = deadline - time.monotonic()
+                if remaining > 0:
+                    batch.append(self._queue.get(timeout=remaining))
+                else:
+                    batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self):
+        try:
+            conn = connect(self.db_path, isolation_level=None)
+            ensure_schema(conn)
+        except Exception as e:
+            self._fail_queued(e)
+            return
+
+        while True:
+            batch = self._next_batch()
+            stop = batch[-1] is _STOP
+            if stop:
+                batch.pop()
+            if batch:
+                try:
+                    self._commit_batch(conn, batch)
+                except Exception as e:
+                    # Never let the writer die: callers would wait forever
+                    self._abort(conn, batch, e)
+            if stop:
+                break
+        conn.close()
+
+    def _fail_queued(self, error):
+        """Fail everything queued now or later; used when the writer cannot start."""
+        with self._state_lock:
+            self._error = error
+            while True:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is not _STOP:
+                    item[0].set_exception(error)
+
+    @staticmethod
+    def _abort(conn, batch, error):
+        try:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+        except sqlite3.Error:
+            pass
+        for future, _, _ in batch:
+            if not future.done():
+                future.set_exception(error)
+
+    def _commit_batch(self, conn, batch):
+        done = []
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+        except sqlite3.Error as e:
+            for future, _, _ in batch:
+                future.set_exception(e)
+            return
+
+        for i, (future, fn, args) in enumerate(batch):
+            if not future.set_running_or_notify_cancel():
+                continue
+            conn.execute("SAVEPOINT op")
+            error = None
+            try:
+                result = fn(conn, *args)
+            except Exception as e:
+                error = e
+            try:
+                if error is not None:
+                    conn.execute("ROLLBACK TO op")
+                conn.execute("RELEASE op")
+            except sqlite3.Error:
+                # The operation ended the transaction itself (COMMIT/ROLLBACK), so
+                # the savepoint is gone: abandon the whole batch and rerun the
+                # operations that had not started yet in a fresh one
+                broken = sqlite3.OperationalError("write operation ended the batch transaction")
+                self._abort(conn, [(future, fn, args)], error or broken)
+                # Whether earlier operations were committed depends on what it ran
+                self._abort(conn, [(f, None, None) for f, _ in done], sqlite3.OperationalError(
+                    "another operation in the batch ended the transaction; this write may not have been saved"
+                ))
+                self._last_commit = time.monotonic()
+                if batch[i + 1:]:
+                    self._commit_batch(conn, batch[i + 1:])
+                return
+            if error is not None:
+                future.set_exception(error)
+            else:
+                done.append((future, result))
+
+        try:
+            conn.execute("COMMIT")
+        except sqlite3.Error as e:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            for future, _ in done:
+                future.set_exception(e)
+        else:
+            for future, result in done:
+                future.set_result(result)
+        finally:
+            self._last_commit = time.monotonic()
+            self.commit_count += 1
+
+
+_queues = {}
+_queues_lock = threading.Lock()
+
+
+def get_write_queue(db_path=DB_PATH):
+    """Process-wide write queue for ``db_path``, started on first use."""
+    with _queues_lock:
+        # Replace a writer that could not start (e.g. a bad path) so a later call can retry
+        if db_path not in _queues or not _queues[db_path].alive:
+            _queues[db_path] = WriteQueue(db_path)
+        return _queues[db_path]
+
+
+def run_write(fn, *args, db_path=DB_PATH, timeout=None):
+    """Submit ``fn`` to the write queue and wait for its result."""
+    return get_write_queue(db_path).submit(fn, *args).result(timeout)